@@ -15,161 +15,98 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# Rows per backfill UPDATE; each batch commits on its own
+BACKFILL_BATCH_SIZE = 10000
+
 
 def upgrade():
     """Add missing columns to quizzes table (SAFE: Only adds columns, never deletes data)"""
     
-    # SAFETY: Check and add columns only if they don't exist to prevent errors
-    # Add instructions column
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'instructions') THEN
-                ALTER TABLE quizzes ADD COLUMN instructions TEXT;
-            END IF;
-        END $$;
-    """)
-    
-    # Create enum type first (if it doesn't exist)
-    quizstatus_enum = sa.Enum('DRAFT', 'PUBLISHED', 'ARCHIVED', name='quizstatus')
-    quizstatus_enum.create(op.get_bind(), checkfirst=True)
-    
-    # Add status column (enum) - only if it doesn't exist
+    # Create enum type first (if it doesn't exist) in a single statement
     op.execute("""
-        DO $$ 
+        DO $$
         BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'status') THEN
-                ALTER TABLE quizzes ADD COLUMN status quizstatus;
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'quizstatus') THEN
+                CREATE TYPE quizstatus AS ENUM ('DRAFT', 'PUBLISHED', 'ARCHIVED');
             END IF;
         END $$;
     """)
     
-    # Add shuffle_questions column
+    # SAFETY: ADD COLUMN IF NOT EXISTS skips columns that are already present.
+    # All columns are added in one ALTER TABLE so the table lock is taken once.
+    # Existing rows pick up the DEFAULT values without a table rewrite, so no
+    # UPDATE backfill is needed for the newly added columns.
     op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'shuffle_questions') THEN
-                ALTER TABLE quizzes ADD COLUMN shuffle_questions BOOLEAN;
-            END IF;
-        END $$;
+        ALTER TABLE quizzes
+            ADD COLUMN IF NOT EXISTS instructions TEXT,
+            ADD COLUMN IF NOT EXISTS status quizstatus DEFAULT 'DRAFT',
+            ADD COLUMN IF NOT EXISTS shuffle_questions BOOLEAN DEFAULT false,
+            ADD COLUMN IF NOT EXISTS show_correct_answers BOOLEAN DEFAULT true,
+            ADD COLUMN IF NOT EXISTS show_results_immediately BOOLEAN DEFAULT true,
+            ADD COLUMN IF NOT EXISTS total_points DOUBLE PRECISION DEFAULT 100.0,
+            ADD COLUMN IF NOT EXISTS points_per_question DOUBLE PRECISION DEFAULT 1.0,
+            ADD COLUMN IF NOT EXISTS total_questions INTEGER DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS total_submissions INTEGER DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS average_score DOUBLE PRECISION DEFAULT 0.0,
+            ADD COLUMN IF NOT EXISTS published_at TIMESTAMPTZ
     """)
     
-    # Add show_correct_answers column
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'show_correct_answers') THEN
-                ALTER TABLE quizzes ADD COLUMN show_correct_answers BOOLEAN;
-            END IF;
-        END $$;
-    """)
-    
-    # Add show_results_immediately column
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'show_results_immediately') THEN
-                ALTER TABLE quizzes ADD COLUMN show_results_immediately BOOLEAN;
-            END IF;
-        END $$;
-    """)
-    
-    # Add scoring columns
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'total_points') THEN
-                ALTER TABLE quizzes ADD COLUMN total_points DOUBLE PRECISION;
-            END IF;
-        END $$;
-    """)
-    
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'points_per_question') THEN
-                ALTER TABLE quizzes ADD COLUMN points_per_question DOUBLE PRECISION;
-            END IF;
-        END $$;
-    """)
-    
-    # Add statistics columns
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'total_questions') THEN
-                ALTER TABLE quizzes ADD COLUMN total_questions INTEGER;
-            END IF;
-        END $$;
-    """)
-    
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'total_submissions') THEN
-                ALTER TABLE quizzes ADD COLUMN total_submissions INTEGER;
-            END IF;
-        END $$;
-    """)
-    
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'average_score') THEN
-                ALTER TABLE quizzes ADD COLUMN average_score DOUBLE PRECISION;
-            END IF;
-        END $$;
-    """)
-    
-    # Add published_at column
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'quizzes' AND column_name = 'published_at') THEN
-                ALTER TABLE quizzes ADD COLUMN published_at TIMESTAMPTZ;
-            END IF;
-        END $$;
-    """)
-    
-    # SAFETY: Set default values ONLY for NULL values (never overwrite existing data)
-    op.execute("UPDATE quizzes SET status = 'DRAFT' WHERE status IS NULL")
-    op.execute("UPDATE quizzes SET shuffle_questions = false WHERE shuffle_questions IS NULL")
-    op.execute("UPDATE quizzes SET show_correct_answers = true WHERE show_correct_answers IS NULL")
-    op.execute("UPDATE quizzes SET show_results_immediately = true WHERE show_results_immediately IS NULL")
-    op.execute("UPDATE quizzes SET total_points = 100.0 WHERE total_points IS NULL")
-    op.execute("UPDATE quizzes SET points_per_question = 1.0 WHERE points_per_question IS NULL")
-    op.execute("UPDATE quizzes SET total_questions = 0 WHERE total_questions IS NULL")
-    op.execute("UPDATE quizzes SET total_submissions = 0 WHERE total_submissions IS NULL")
-    op.execute("UPDATE quizzes SET average_score = 0.0 WHERE average_score IS NULL")
+    # SAFETY: Columns that already existed may still hold NULLs. Fill them in a
+    # single pass (never overwrites existing data); rows picked up the DEFAULTs
+    # above for newly added columns, so this only touches legacy NULL rows.
+    # The pass walks id ranges and commits each batch, so a large table is never
+    # held under one long transaction and autovacuum can keep up.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        min_id, max_id = bind.execute(sa.text("SELECT min(id), max(id) FROM quizzes")).one()
+        if min_id is not None:
+            for batch_start in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+                bind.execute(
+                    sa.text("""
+                        UPDATE quizzes SET
+                            status = COALESCE(status, 'DRAFT'),
+                            shuffle_questions = COALESCE(shuffle_questions, false),
+                            show_correct_answers = COALESCE(show_correct_answers, true),
+                            show_results_immediately = COALESCE(show_results_immediately, true),
+                            total_points = COALESCE(total_points, 100.0),
+                            points_per_question = COALESCE(points_per_question, 1.0),
+                            total_questions = COALESCE(total_questions, 0),
+                            total_submissions = COALESCE(total_submissions, 0),
+                            average_score = COALESCE(average_score, 0.0)
+                        WHERE id >= :batch_start AND id < :batch_end AND (
+                            status IS NULL
+                            OR shuffle_questions IS NULL
+                            OR show_correct_answers IS NULL
+                            OR show_results_immediately IS NULL
+                            OR total_points IS NULL
+                            OR points_per_question IS NULL
+                            OR total_questions IS NULL
+                            OR total_submissions IS NULL
+                            OR average_score IS NULL
+                        )
+                    """),
+                    {"batch_start": batch_start, "batch_end": batch_start + BACKFILL_BATCH_SIZE},
+                )
 
 
 def downgrade():
     """Remove added columns from quizzes table"""
     
-    # Remove added columns
-    op.drop_column('quizzes', 'published_at')
-    op.drop_column('quizzes', 'average_score')
-    op.drop_column('quizzes', 'total_submissions')
-    op.drop_column('quizzes', 'total_questions')
-    op.drop_column('quizzes', 'points_per_question')
-    op.drop_column('quizzes', 'total_points')
-    op.drop_column('quizzes', 'show_results_immediately')
-    op.drop_column('quizzes', 'show_correct_answers')
-    op.drop_column('quizzes', 'shuffle_questions')
-    op.drop_column('quizzes', 'status')
-    op.drop_column('quizzes', 'instructions')
+    # Remove added columns in one ALTER TABLE so the table lock is taken once
+    op.execute("""
+        ALTER TABLE quizzes
+            DROP COLUMN IF EXISTS published_at,
+            DROP COLUMN IF EXISTS average_score,
+            DROP COLUMN IF EXISTS total_submissions,
+            DROP COLUMN IF EXISTS total_questions,
+            DROP COLUMN IF EXISTS points_per_question,
+            DROP COLUMN IF EXISTS total_points,
+            DROP COLUMN IF EXISTS show_results_immediately,
+            DROP COLUMN IF EXISTS show_correct_answers,
+            DROP COLUMN IF EXISTS shuffle_questions,
+            DROP COLUMN IF EXISTS status,
+            DROP COLUMN IF EXISTS instructions
+    """)
     
     # Drop the enum type
-    quizstatus_enum = sa.Enum('DRAFT', 'PUBLISHED', 'ARCHIVED', name='quizstatus')
-    quizstatus_enum.drop(op.get_bind())
+    op.execute("DROP TYPE IF EXISTS quizstatus")
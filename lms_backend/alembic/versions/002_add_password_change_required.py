@@ -19,29 +19,14 @@ depends_on = None
 def upgrade():
     """Add password_change_required column to users table"""
     
-    # SAFETY: Check and add column only if it doesn't exist
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'users' AND column_name = 'password_change_required') THEN
-                ALTER TABLE users ADD COLUMN password_change_required BOOLEAN DEFAULT FALSE;
-            END IF;
-        END $$;
-    """)
+    # SAFETY: Add column only if it doesn't exist
+    op.execute(
+        "ALTER TABLE users ADD COLUMN IF NOT EXISTS password_change_required BOOLEAN DEFAULT FALSE"
+    )
 
 
 def downgrade():
     """Remove password_change_required column from users table"""
     
-    # SAFETY: Check if column exists before dropping
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF EXISTS (SELECT 1 FROM information_schema.columns 
-                      WHERE table_name = 'users' AND column_name = 'password_change_required') THEN
-                ALTER TABLE users DROP COLUMN password_change_required;
-            END IF;
-        END $$;
-    """)
-
+    # SAFETY: Drop column only if it exists
+    op.execute("ALTER TABLE users DROP COLUMN IF EXISTS password_change_required")
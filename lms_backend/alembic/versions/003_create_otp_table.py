@@ -7,7 +7,6 @@ Create Date: 2025-01-15 10:00:00.000000
 """
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision = '003'
@@ -19,43 +18,27 @@ depends_on = None
 def upgrade():
     """Create OTP table for email verification"""
     
-    # Check if table already exists
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.tables 
-                          WHERE table_name = 'otps') THEN
-                CREATE TABLE otps (
-                    id SERIAL PRIMARY KEY,
-                    email VARCHAR(255) NOT NULL,
-                    code VARCHAR(6) NOT NULL,
-                    purpose VARCHAR(50) NOT NULL DEFAULT 'registration',
-                    is_verified BOOLEAN DEFAULT FALSE,
-                    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
-                    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                    verified_at TIMESTAMP WITH TIME ZONE,
-                    user_id INTEGER REFERENCES users(id)
-                );
-                
-                CREATE INDEX idx_otps_email ON otps(email);
-                CREATE INDEX idx_otps_code ON otps(code);
-                CREATE INDEX idx_otps_purpose ON otps(purpose);
-            END IF;
-        END $$;
-    """)
+    # Create table and indexes only if they don't already exist
+    op.create_table(
+        'otps',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('email', sa.String(255), nullable=False),
+        sa.Column('code', sa.String(6), nullable=False),
+        sa.Column('purpose', sa.String(50), nullable=False, server_default='registration'),
+        sa.Column('is_verified', sa.Boolean(), server_default=sa.false()),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('verified_at', sa.DateTime(timezone=True)),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id')),
+        if_not_exists=True,
+    )
+    op.create_index('idx_otps_email', 'otps', ['email'], if_not_exists=True)
+    op.create_index('idx_otps_code', 'otps', ['code'], if_not_exists=True)
+    op.create_index('idx_otps_purpose', 'otps', ['purpose'], if_not_exists=True)
 
 
 def downgrade():
     """Drop OTP table"""
     
-    # Check if table exists before dropping
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF EXISTS (SELECT 1 FROM information_schema.tables 
-                      WHERE table_name = 'otps') THEN
-                DROP TABLE otps;
-            END IF;
-        END $$;
-    """)
-
+    # Drop table only if it exists
+    op.drop_table('otps', if_exists=True)
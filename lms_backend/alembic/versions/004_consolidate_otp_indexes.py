@@ -0,0 +1,41 @@
+"""Consolidate OTP indexes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Replace the single-column OTP indexes with an (email, purpose) index and a partial code index"""
+    
+    # OTP lookups filter by (email, purpose) and then by code on unverified rows,
+    # so one composite index plus a partial index cover both hot paths.
+    op.execute("CREATE INDEX IF NOT EXISTS idx_otps_email_purpose ON otps(email, purpose)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_otps_active_code ON otps(code) WHERE is_verified = false")
+    
+    # The composite index serves email-only lookups through its left prefix
+    op.execute("DROP INDEX IF EXISTS idx_otps_email")
+    op.execute("DROP INDEX IF EXISTS ix_otps_email")
+    op.execute("DROP INDEX IF EXISTS idx_otps_code")
+    op.execute("DROP INDEX IF EXISTS idx_otps_purpose")
+
+
+def downgrade():
+    """Restore the single-column OTP indexes"""
+    
+    op.execute("CREATE INDEX IF NOT EXISTS idx_otps_email ON otps(email)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_otps_code ON otps(code)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_otps_purpose ON otps(purpose)")
+    op.execute("DROP INDEX IF EXISTS idx_otps_active_code")
+    op.execute("DROP INDEX IF EXISTS idx_otps_email_purpose")
@@ -0,0 +1,107 @@
+"""Create trigger-maintained platform counters
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+# (counter key, table) pairs maintained by platform_counters_adjust()
+ROW_COUNTERS = [
+    ('total_organizations', 'organizations'),
+    ('total_users', 'users'),
+    ('total_courses', 'courses'),
+]
+
+
+def upgrade():
+    """Create platform_counters and the triggers that keep it in sync"""
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS platform_counters (
+            key TEXT PRIMARY KEY,
+            value BIGINT NOT NULL DEFAULT 0
+        )
+    """)
+
+    # Row counters: +1 on INSERT, -1 on DELETE of the table passed as TG_ARGV[0]
+    op.execute("""
+        CREATE OR REPLACE FUNCTION platform_counters_adjust() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE platform_counters SET value = value + 1 WHERE key = TG_ARGV[0];
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE platform_counters SET value = value - 1 WHERE key = TG_ARGV[0];
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Active organizations also change when is_active is toggled
+    op.execute("""
+        CREATE OR REPLACE FUNCTION platform_counters_adjust_active_orgs() RETURNS trigger AS $$
+        DECLARE
+            delta INTEGER := 0;
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') AND COALESCE(NEW.is_active, false) THEN
+                delta := delta + 1;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') AND COALESCE(OLD.is_active, false) THEN
+                delta := delta - 1;
+            END IF;
+            IF delta <> 0 THEN
+                UPDATE platform_counters SET value = value + delta WHERE key = 'active_organizations';
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Block writes while seeding so the seeded counts and the triggers agree
+    op.execute("LOCK TABLE organizations, users, courses IN SHARE MODE")
+
+    for key, table in ROW_COUNTERS:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_platform_counter ON {table}")
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_platform_counter
+            AFTER INSERT OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION platform_counters_adjust('{key}')
+        """)
+
+    op.execute("DROP TRIGGER IF EXISTS trg_organizations_active_counter ON organizations")
+    op.execute("""
+        CREATE TRIGGER trg_organizations_active_counter
+        AFTER INSERT OR UPDATE OF is_active OR DELETE ON organizations
+        FOR EACH ROW EXECUTE FUNCTION platform_counters_adjust_active_orgs()
+    """)
+
+    op.execute("""
+        INSERT INTO platform_counters (key, value)
+        SELECT 'total_organizations', count(id) FROM organizations
+        UNION ALL SELECT 'active_organizations', count(id) FROM organizations WHERE is_active
+        UNION ALL SELECT 'total_users', count(id) FROM users
+        UNION ALL SELECT 'total_courses', count(id) FROM courses
+        ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value
+    """)
+
+
+def downgrade():
+    """Drop platform_counters and its triggers"""
+
+    op.execute("DROP TRIGGER IF EXISTS trg_organizations_active_counter ON organizations")
+    for _, table in ROW_COUNTERS:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_platform_counter ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS platform_counters_adjust_active_orgs()")
+    op.execute("DROP FUNCTION IF EXISTS platform_counters_adjust()")
+    op.execute("DROP TABLE IF EXISTS platform_counters")
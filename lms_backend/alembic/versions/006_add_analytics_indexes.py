@@ -0,0 +1,42 @@
+"""Add indexes for platform analytics queries
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add indexes backing the live queries in platform stats"""
+    
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # New organizations this month: created_at range scan
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orgs_created_at "
+            "ON organizations(created_at)"
+        )
+        # Paid revenue: index-only SUM over paid enrollments
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enrollments_paid "
+            "ON enrollments(payment_amount) "
+            "WHERE payment_status = 'paid' AND payment_amount IS NOT NULL"
+        )
+
+
+def downgrade():
+    """Drop platform analytics indexes"""
+    
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_enrollments_paid")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_orgs_created_at")
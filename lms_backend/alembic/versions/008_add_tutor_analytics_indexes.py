@@ -0,0 +1,44 @@
+"""Add covering indexes for tutor analytics queries
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add indexes backing the tutor analytics aggregates"""
+    
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Tutor's courses: equality on creator and organization, newest first
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_courses_creator "
+            "ON courses(created_by, organization_id, created_at DESC)"
+        )
+        # Enrollment aggregates: course_id IN (...) and enrollment_date range,
+        # with every aggregated column included for index-only scans (the
+        # queries count(*) rather than count(id), which is not in the index)
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enrollments_course_date "
+            "ON enrollments(course_id, enrollment_date DESC) "
+            "INCLUDE (payment_status, payment_amount, completion_date, progress_percentage, student_id)"
+        )
+
+
+def downgrade():
+    """Drop tutor analytics indexes"""
+    
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_enrollments_course_date")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_courses_creator")
@@ -0,0 +1,36 @@
+"""Add keyset index for course listings
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the index backing cursor pagination of course listings"""
+    
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Course listings: ORDER BY created_at DESC, id DESC and
+        # (created_at, id) < cursor seek straight into this index
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_courses_created_id "
+            "ON courses(created_at DESC, id DESC)"
+        )
+
+
+def downgrade():
+    """Drop course listing index"""
+    
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_courses_created_id")
@@ -0,0 +1,36 @@
+"""Add index for status and organization filtered course listings
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the index backing status and organization filtered course listings"""
+    
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Equality on status and organization_id, then (created_at, id) keeps
+        # the listing's id subquery ordered without a sort
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_courses_status_org_created "
+            "ON courses(status, organization_id, created_at DESC, id DESC)"
+        )
+
+
+def downgrade():
+    """Drop filtered course listing index"""
+    
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_courses_status_org_created")
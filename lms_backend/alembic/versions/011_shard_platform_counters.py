@@ -0,0 +1,150 @@
+"""Shard platform counters and reset them on TRUNCATE
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+# Rows per counter key; readers sum them. Each connection updates the slot picked
+# by its backend pid, so concurrent writers rarely wait on the same row lock.
+PLATFORM_COUNTER_SLOTS = 16
+
+# (table, counter keys reset when the table is truncated)
+TRUNCATE_COUNTERS = [
+    ('organizations', ['total_organizations', 'active_organizations']),
+    ('users', ['total_users']),
+    ('courses', ['total_courses']),
+]
+
+
+def upgrade():
+    """Split each platform counter into slots and handle TRUNCATE"""
+
+    # The existing value stays in slot 0; the other slots start at 0
+    op.execute("ALTER TABLE platform_counters ADD COLUMN slot SMALLINT NOT NULL DEFAULT 0")
+    op.execute("ALTER TABLE platform_counters DROP CONSTRAINT platform_counters_pkey")
+    op.execute("ALTER TABLE platform_counters ADD PRIMARY KEY (key, slot)")
+    op.execute(f"""
+        INSERT INTO platform_counters (key, slot, value)
+        SELECT counters.key, slots.slot, 0
+        FROM platform_counters AS counters,
+             generate_series(1, {PLATFORM_COUNTER_SLOTS - 1}) AS slots(slot)
+        ON CONFLICT DO NOTHING
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION platform_counters_adjust() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE platform_counters SET value = value + 1
+                WHERE key = TG_ARGV[0] AND slot = pg_backend_pid() % {PLATFORM_COUNTER_SLOTS};
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE platform_counters SET value = value - 1
+                WHERE key = TG_ARGV[0] AND slot = pg_backend_pid() % {PLATFORM_COUNTER_SLOTS};
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION platform_counters_adjust_active_orgs() RETURNS trigger AS $$
+        DECLARE
+            delta INTEGER := 0;
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') AND COALESCE(NEW.is_active, false) THEN
+                delta := delta + 1;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') AND COALESCE(OLD.is_active, false) THEN
+                delta := delta - 1;
+            END IF;
+            IF delta <> 0 THEN
+                UPDATE platform_counters SET value = value + delta
+                WHERE key = 'active_organizations' AND slot = pg_backend_pid() % {PLATFORM_COUNTER_SLOTS};
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # TRUNCATE skips row triggers (including cascaded truncates), so zero the
+    # table's counters from a statement-level trigger instead
+    op.execute("""
+        CREATE OR REPLACE FUNCTION platform_counters_reset() RETURNS trigger AS $$
+        BEGIN
+            UPDATE platform_counters SET value = 0 WHERE key = ANY(TG_ARGV);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table, keys in TRUNCATE_COUNTERS:
+        args = ", ".join(f"'{key}'" for key in keys)
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_platform_counter_truncate ON {table}")
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_platform_counter_truncate
+            AFTER TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION platform_counters_reset({args})
+        """)
+
+
+def downgrade():
+    """Fold the slots back into one row per counter and drop the TRUNCATE triggers"""
+
+    for table, _ in TRUNCATE_COUNTERS:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_platform_counter_truncate ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS platform_counters_reset()")
+
+    # Restore the single-row trigger functions from revision 005
+    op.execute("""
+        CREATE OR REPLACE FUNCTION platform_counters_adjust() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE platform_counters SET value = value + 1 WHERE key = TG_ARGV[0];
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE platform_counters SET value = value - 1 WHERE key = TG_ARGV[0];
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION platform_counters_adjust_active_orgs() RETURNS trigger AS $$
+        DECLARE
+            delta INTEGER := 0;
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') AND COALESCE(NEW.is_active, false) THEN
+                delta := delta + 1;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') AND COALESCE(OLD.is_active, false) THEN
+                delta := delta - 1;
+            END IF;
+            IF delta <> 0 THEN
+                UPDATE platform_counters SET value = value + delta WHERE key = 'active_organizations';
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        UPDATE platform_counters AS p SET value = totals.value
+        FROM (SELECT key, sum(value) AS value FROM platform_counters GROUP BY key) AS totals
+        WHERE p.key = totals.key AND p.slot = 0
+    """)
+    op.execute("DELETE FROM platform_counters WHERE slot <> 0")
+    op.execute("ALTER TABLE platform_counters DROP CONSTRAINT platform_counters_pkey")
+    op.execute("ALTER TABLE platform_counters DROP COLUMN slot")
+    op.execute("ALTER TABLE platform_counters ADD PRIMARY KEY (key)")
@@ -0,0 +1,45 @@
+"""Normalize stored course status values to the enum names
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Rewrite mixed-case course status values as the enum names the ORM stores"""
+
+    # Course listings compare status for equality (so idx_courses_status_org_created
+    # applies) instead of lower(CAST(status AS VARCHAR)). Databases where the
+    # column is VARCHAR may hold values such as 'Published' or ' draft', which
+    # equality would silently skip. A native enum column can only hold its own
+    # labels, so there is nothing to rewrite there.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'courses' AND column_name = 'status'
+                  AND data_type IN ('character varying', 'text')
+            ) THEN
+                UPDATE courses SET status = upper(btrim(status))
+                WHERE upper(btrim(status)) IN ('DRAFT', 'PUBLISHED', 'ARCHIVED', 'SCHEDULED')
+                  AND status <> upper(btrim(status));
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade():
+    """Original casing is not recorded, so values stay normalized"""
+    pass
@@ -17,117 +17,75 @@ down_revision: Union[str, Sequence[str], None] = '001'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows per backfill UPDATE; each batch commits on its own
+BACKFILL_BATCH_SIZE = 10000
+
 
 def upgrade() -> None:
     """Add missing columns to lesson_progress table (only columns that don't exist)"""
     
-    # Check and add status column only if it doesn't exist
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'lesson_progress' AND column_name = 'status') THEN
-                ALTER TABLE lesson_progress ADD COLUMN status VARCHAR(50) DEFAULT 'not_started';
-            END IF;
-        END $$;
-    """)
-    
-    # Check and add completion_percentage column only if it doesn't exist
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'lesson_progress' AND column_name = 'completion_percentage') THEN
-                ALTER TABLE lesson_progress ADD COLUMN completion_percentage DOUBLE PRECISION DEFAULT 0.0;
-            END IF;
-        END $$;
-    """)
-    
-    # Check and add video_watched_duration column only if it doesn't exist
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'lesson_progress' AND column_name = 'video_watched_duration') THEN
-                ALTER TABLE lesson_progress ADD COLUMN video_watched_duration INTEGER DEFAULT 0;
-            END IF;
-        END $$;
-    """)
-    
-    # Check and add completion criteria columns only if they don't exist
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'lesson_progress' AND column_name = 'video_completed') THEN
-                ALTER TABLE lesson_progress ADD COLUMN video_completed BOOLEAN DEFAULT false; u
-            END IF;
-        END $$;
-    """)
-    
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'lesson_progress' AND column_name = 'quiz_completed') THEN
-                ALTER TABLE lesson_progress ADD COLUMN quiz_completed BOOLEAN DEFAULT false;
-            END IF;
-        END $$;
-    """)
-    
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'lesson_progress' AND column_name = 'assignment_completed') THEN
-                ALTER TABLE lesson_progress ADD COLUMN assignment_completed BOOLEAN DEFAULT false;
-            END IF;
-        END $$;
-    """)
-    
-    # Check and add started_at column only if it doesn't exist
-    op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'lesson_progress' AND column_name = 'started_at') THEN
-                ALTER TABLE lesson_progress ADD COLUMN started_at TIMESTAMPTZ;
-            END IF;
-        END $$;
-    """)
-    
-    # Check and add last_accessed_at column only if it doesn't exist
+    # ADD COLUMN IF NOT EXISTS skips columns that are already present.
+    # All columns are added in one ALTER TABLE so the table lock is taken once.
+    # Existing rows pick up the DEFAULT values without a table rewrite, so no
+    # UPDATE backfill is needed for the newly added columns.
     op.execute("""
-        DO $$ 
-        BEGIN
-            IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
-                          WHERE table_name = 'lesson_progress' AND column_name = 'last_accessed_at') THEN
-                ALTER TABLE lesson_progress ADD COLUMN last_accessed_at TIMESTAMPTZ DEFAULT NOW();
-            END IF;
-        END $$;
+        ALTER TABLE lesson_progress
+            ADD COLUMN IF NOT EXISTS status VARCHAR(50) DEFAULT 'not_started',
+            ADD COLUMN IF NOT EXISTS completion_percentage DOUBLE PRECISION DEFAULT 0.0,
+            ADD COLUMN IF NOT EXISTS video_watched_duration INTEGER DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS video_completed BOOLEAN DEFAULT false,
+            ADD COLUMN IF NOT EXISTS quiz_completed BOOLEAN DEFAULT false,
+            ADD COLUMN IF NOT EXISTS assignment_completed BOOLEAN DEFAULT false,
+            ADD COLUMN IF NOT EXISTS started_at TIMESTAMPTZ,
+            ADD COLUMN IF NOT EXISTS last_accessed_at TIMESTAMPTZ DEFAULT NOW()
     """)
     
-    # Update existing records with default values for newly added columns
-    op.execute("UPDATE lesson_progress SET status = 'not_started' WHERE status IS NULL")
-    op.execute("UPDATE lesson_progress SET completion_percentage = 0.0 WHERE completion_percentage IS NULL")
-    op.execute("UPDATE lesson_progress SET video_watched_duration = 0 WHERE video_watched_duration IS NULL")
-    op.execute("UPDATE lesson_progress SET video_completed = false WHERE video_completed IS NULL")
-    op.execute("UPDATE lesson_progress SET quiz_completed = false WHERE quiz_completed IS NULL")
-    op.execute("UPDATE lesson_progress SET assignment_completed = false WHERE assignment_completed IS NULL")
-    op.execute("UPDATE lesson_progress SET last_accessed_at = NOW() WHERE last_accessed_at IS NULL")
+    # Columns that already existed may still hold NULLs; fill them in a single
+    # pass over id ranges, committing each batch so the table is never held
+    # under one long transaction.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        min_id, max_id = bind.execute(sa.text("SELECT min(id), max(id) FROM lesson_progress")).one()
+        if min_id is not None:
+            for batch_start in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+                bind.execute(
+                    sa.text("""
+                        UPDATE lesson_progress SET
+                            status = COALESCE(status, 'not_started'),
+                            completion_percentage = COALESCE(completion_percentage, 0.0),
+                            video_watched_duration = COALESCE(video_watched_duration, 0),
+                            video_completed = COALESCE(video_completed, false),
+                            quiz_completed = COALESCE(quiz_completed, false),
+                            assignment_completed = COALESCE(assignment_completed, false),
+                            last_accessed_at = COALESCE(last_accessed_at, NOW())
+                        WHERE id >= :batch_start AND id < :batch_end AND (
+                            status IS NULL
+                            OR completion_percentage IS NULL
+                            OR video_watched_duration IS NULL
+                            OR video_completed IS NULL
+                            OR quiz_completed IS NULL
+                            OR assignment_completed IS NULL
+                            OR last_accessed_at IS NULL
+                        )
+                    """),
+                    {"batch_start": batch_start, "batch_end": batch_start + BACKFILL_BATCH_SIZE},
+                )
 
 
 def downgrade() -> None:
     """Remove added columns from lesson_progress table (only if they exist)"""
     
-    # Drop columns only if they exist
-    op.execute("ALTER TABLE lesson_progress DROP COLUMN IF EXISTS last_accessed_at")
-    op.execute("ALTER TABLE lesson_progress DROP COLUMN IF EXISTS started_at")
-    op.execute("ALTER TABLE lesson_progress DROP COLUMN IF EXISTS assignment_completed")
-    op.execute("ALTER TABLE lesson_progress DROP COLUMN IF EXISTS quiz_completed")
-    op.execute("ALTER TABLE lesson_progress DROP COLUMN IF EXISTS video_completed")
-    op.execute("ALTER TABLE lesson_progress DROP COLUMN IF EXISTS video_watched_duration")
-    op.execute("ALTER TABLE lesson_progress DROP COLUMN IF EXISTS completion_percentage")
-    op.execute("ALTER TABLE lesson_progress DROP COLUMN IF EXISTS status")
+    # Drop columns only if they exist, in one ALTER TABLE
+    op.execute("""
+        ALTER TABLE lesson_progress
+            DROP COLUMN IF EXISTS last_accessed_at,
+            DROP COLUMN IF EXISTS started_at,
+            DROP COLUMN IF EXISTS assignment_completed,
+            DROP COLUMN IF EXISTS quiz_completed,
+            DROP COLUMN IF EXISTS video_completed,
+            DROP COLUMN IF EXISTS video_watched_duration,
+            DROP COLUMN IF EXISTS completion_percentage,
+            DROP COLUMN IF EXISTS status
+    """)
     
     # Note: We don't drop completed_at or time_spent_seconds as they already existed
@@ -1,91 +1,464 @@
 """
 Analytics API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, case, cast, distinct, literal, table, column, BigInteger, DateTime
+from sqlalchemy.exc import ProgrammingError
 from datetime import datetime, timedelta
+import asyncio
+import hashlib
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.config import settings
+from app.core.database import get_db, AsyncSessionLocal
+from app.core.dependencies import require_roles
+from app.core.logging import app_logger
 from app.models.user import User
 from app.models.organization import Organization
 from app.models.course import Course, Enrollment
+from app.services.cache_service import cache_service
+from app.services.analytics_cache import (
+    PLATFORM_STATS_CACHE_KEY,
+    PLATFORM_STATS_CACHE_TTL,
+    TUTOR_ANALYTICS_CACHE_TTL,
+    TUTOR_ANALYTICS_PERIODS,
+    tutor_analytics_cache_key,
+)
 from typing import Optional
 from fastapi import Query
 
 router = APIRouter()
 
+# Browsers may reuse analytics responses for this long without asking again
+PLATFORM_STATS_MAX_AGE = 30
+TUTOR_ANALYTICS_MAX_AGE = 30
+
+# Tutor analytics period lengths ("all" has no lower bound)
+TUTOR_PERIOD_LENGTHS = {
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+    "90d": timedelta(days=90),
+    "all": None,
+}
+# Trend buckets per period: daily for 7d/30d, twelve weeks otherwise
+TUTOR_TREND_BUCKETS = {
+    "7d": (7, timedelta(days=1)),
+    "30d": (30, timedelta(days=1)),
+    "90d": (12, timedelta(weeks=1)),
+    "all": (12, timedelta(weeks=1)),
+}
+
+# Process-wide cap on concurrently running analytics statements, kept well under
+# the pool size so concurrent cold requests cannot drain the pool between them
+ANALYTICS_QUERY_CONCURRENCY = max(1, settings.DATABASE_POOL_SIZE // 4)
+_analytics_query_slots = asyncio.Semaphore(ANALYTICS_QUERY_CONCURRENCY)
+
+# Trigger-maintained row counts (see alembic revisions 005 and 011), one row per
+# (key, slot); a counter's value is the sum of its slots
+platform_counters = table("platform_counters", column("key"), column("value"))
+
+
+def _platform_counter(key: str):
+    """Scalar subquery reading one trigger-maintained platform counter"""
+    # sum(bigint) is numeric in PostgreSQL; cast back so the value is an int, not a Decimal
+    return (
+        select(cast(func.sum(platform_counters.c.value), BigInteger))
+        .where(platform_counters.c.key == key)
+        .scalar_subquery()
+    )
+
+
+# Live equivalents of the platform counters, for databases without the
+# platform_counters table (created by migrations only, not by init_db)
+PLATFORM_LIVE_COUNTS = {
+    "total_organizations": select(func.count(Organization.id)).scalar_subquery(),
+    "active_organizations": (
+        select(func.count(Organization.id)).where(Organization.is_active.is_(True)).scalar_subquery()
+    ),
+    "total_users": select(func.count(User.id)).scalar_subquery(),
+    "total_courses": select(func.count(Course.id)).scalar_subquery(),
+}
+
+
+def _platform_stats_query(counter):
+    """
+    Every platform stat in a single round-trip using scalar subqueries;
+    counter(key) supplies the totals, new orgs and revenue are live queries
+    """
+    return select(
+        counter("total_organizations").label("total_organizations"),
+        counter("active_organizations").label("active_organizations"),
+        # count(*) lets idx_orgs_created_at answer this with an index-only scan
+        select(func.count())
+        .select_from(Organization)
+        .where(Organization.created_at >= func.date_trunc("month", func.now()))
+        .scalar_subquery().label("new_organizations_this_month"),
+        counter("total_users").label("total_users"),
+        counter("total_courses").label("total_courses"),
+        select(func.coalesce(func.sum(Enrollment.payment_amount), 0))
+        .where(and_(
+            Enrollment.payment_status == "paid",
+            Enrollment.payment_amount.isnot(None)
+        ))
+        .scalar_subquery().label("total_revenue"),
+    )
+
+
+# The statements have no parameters, so they are built once and reused by every request
+PLATFORM_STATS_QUERY = _platform_stats_query(_platform_counter)
+PLATFORM_STATS_LIVE_QUERY = _platform_stats_query(PLATFORM_LIVE_COUNTS.__getitem__)
+
+
+async def _fetch_all(statement) -> list:
+    """
+    Run one read-only statement in its own session, so several can run
+    concurrently (an AsyncSession only runs one statement at a time).
+    At most ANALYTICS_QUERY_CONCURRENCY of these hold a connection at once.
+    """
+    async with _analytics_query_slots, AsyncSessionLocal() as session:
+        return (await session.execute(statement)).all()
+
+
+async def _compute_platform_stats() -> dict:
+    """Build the platform stats payload from the database"""
+    try:
+        stats = (await _fetch_all(PLATFORM_STATS_QUERY))[0]
+    except ProgrammingError as e:
+        # platform_counters is missing (schema built by init_db without migrations)
+        app_logger.warning(f"⚠️  Platform counters unavailable, counting live: {str(e.orig)}")
+        stats = (await _fetch_all(PLATFORM_STATS_LIVE_QUERY))[0]
+    
+    return {
+        "total_organizations": stats.total_organizations or 0,
+        "active_organizations": stats.active_organizations or 0,
+        "new_organizations_this_month": stats.new_organizations_this_month or 0,
+        "total_users": stats.total_users or 0,
+        "total_courses": stats.total_courses or 0,
+        "total_revenue": float(stats.total_revenue or 0)
+    }
+
+
+def _cacheable_response(request: Request, payload: dict, max_age: int) -> Response:
+    """
+    Return payload with Cache-Control and ETag headers,
+    or an empty 304 if the client already holds this exact payload
+    """
+    # Render once; the ETag is a hash of the exact bytes sent
+    response = JSONResponse(payload)
+    digest = hashlib.md5(response.body, usedforsecurity=False).hexdigest()
+    etag = f'"{digest}"'
+    headers = {"Cache-Control": f"private, max-age={max_age}", "ETag": etag}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    
+    response.headers.update(headers)
+    return response
+
 
 @router.get("/platform/stats")
 async def get_platform_stats(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    current_user: User = Depends(
+        require_roles("super_admin", detail="Only super admins can access platform stats")
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get platform-wide statistics (Super Admin only)
     Returns total organizations, users, courses, revenue, etc.
     """
-    try:
-        # Check if user is super admin
-        if current_user.role != "super_admin":
-            raise HTTPException(status_code=403, detail="Only super admins can access platform stats")
-        
-        # Get total organizations
-        orgs_result = await db.execute(select(func.count(Organization.id)))
-        total_organizations = orgs_result.scalar() or 0
-        
-        # Get active organizations
-        active_orgs_result = await db.execute(
-            select(func.count(Organization.id)).where(Organization.is_active == True)
+    # Concurrent misses wait on one computation; don't hold a connection meanwhile
+    await db.close()
+    
+    platform_stats = await cache_service.get_or_compute_json(
+        PLATFORM_STATS_CACHE_KEY, PLATFORM_STATS_CACHE_TTL, _compute_platform_stats
+    )
+    
+    return _cacheable_response(request, platform_stats, PLATFORM_STATS_MAX_AGE)
+
+
+async def _compute_tutor_analytics(current_user: User, period: str) -> dict:
+    """Build the tutor analytics payload for one tutor and period from the database"""
+    # Calculate date range based on period
+    now = datetime.now()
+    period_length = TUTOR_PERIOD_LENGTHS[period]
+    start_date = now - period_length if period_length else None
+    
+    # Courses created by this tutor from their organization (and period). Every query
+    # below embeds this as a subquery rather than a fetched id list, so none has to wait
+    # for another. correlate(None) keeps it standalone inside queries that join courses.
+    tutor_course_filters = [
+        Course.created_by == current_user.id,
+        Course.organization_id == current_user.organization_id
+    ]
+    period_course_filters = list(tutor_course_filters)
+    if start_date:
+        period_course_filters.append(Course.created_at >= start_date)
+    tutor_course_ids = select(Course.id).where(*period_course_filters).correlate(None)
+    total_courses_count = (
+        select(func.count(Course.id)).where(*period_course_filters).correlate(None).scalar_subquery()
+    )
+    
+    # Enrollments in the tutor's courses (and period); every aggregate below runs in SQL
+    enrollment_filters = [Enrollment.course_id.in_(tutor_course_ids)]
+    if start_date:
+        enrollment_filters.append(Enrollment.enrollment_date >= start_date)
+    is_completed = Enrollment.completion_date.isnot(None)
+    is_paid = Enrollment.payment_status == "paid"
+    paid_revenue = func.coalesce(func.sum(Enrollment.payment_amount).filter(is_paid), 0)
+    
+    # Previous period of the same length, for growth; courses and enrollments are
+    # counted the same way as the current period (enrollments in courses created then)
+    if start_date:
+        previous_start = start_date - (now - start_date)
+        previous_courses = select(func.count(Course.id)).where(
+            *tutor_course_filters,
+            Course.created_at >= previous_start,
+            Course.created_at < start_date
+        ).scalar_subquery()
+        previous_enrollments = (
+            select(func.count())
+            .select_from(Enrollment)
+            .join(Course, Course.id == Enrollment.course_id)
+            .where(
+                *tutor_course_filters,
+                Course.created_at >= previous_start,
+                Course.created_at < start_date,
+                Enrollment.enrollment_date >= previous_start,
+                Enrollment.enrollment_date < start_date
+            )
+            # Standalone count; must not correlate with the outer enrollments scan
+            .correlate(None)
+            .scalar_subquery()
         )
-        active_organizations = active_orgs_result.scalar() or 0
-        
-        # Get new organizations this month
-        this_month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        new_orgs_result = await db.execute(
-            select(func.count(Organization.id))
-            .where(Organization.created_at >= this_month_start)
+    else:
+        previous_courses = previous_enrollments = literal(0)
+    
+    # Overview stats, student distribution (by completion status) and the
+    # previous-period counts in one aggregate. Enrollment counts use count(*)
+    # so idx_enrollments_course_date answers them without heap fetches.
+    active_date = now - timedelta(days=30)
+    overview_query = select(
+        func.count().label("total_enrollments"),
+        func.count(distinct(Enrollment.student_id))
+        .filter(Enrollment.enrollment_date >= active_date).label("active_students"),
+        paid_revenue.label("total_revenue"),
+        func.count().filter(is_completed).label("completed"),
+        func.count().filter(and_(
+            Enrollment.completion_date.is_(None),
+            Enrollment.progress_percentage > 0
+        )).label("in_progress"),
+        func.count().filter(and_(
+            Enrollment.completion_date.is_(None),
+            Enrollment.progress_percentage == 0
+        )).label("not_started"),
+        previous_courses.label("previous_courses"),
+        previous_enrollments.label("previous_enrollments"),
+        total_courses_count.label("total_courses"),
+    ).where(*enrollment_filters)
+    
+    # Count ALL students in the tutor's organization (not just those with enrollments)
+    # This ensures we count all students, even if they haven't enrolled in courses yet
+    students_query = select(func.count(User.id)).where(
+        and_(
+            User.organization_id == current_user.organization_id,
+            User.role == "student"
         )
-        new_organizations_this_month = new_orgs_result.scalar() or 0
-        
-        # Get total users
-        users_result = await db.execute(select(func.count(User.id)))
-        total_users = users_result.scalar() or 0
-        
-        # Get total courses
-        courses_result = await db.execute(select(func.count(Course.id)))
-        total_courses = courses_result.scalar() or 0
-        
-        # Get total revenue from enrollments
-        revenue_result = await db.execute(
-            select(func.coalesce(func.sum(Enrollment.payment_amount), 0))
-            .where(and_(
-                Enrollment.payment_status == "paid",
-                Enrollment.payment_amount.isnot(None)
-            ))
+    )
+    
+    # Enrollment and revenue trends: daily buckets for 7d/30d, weekly otherwise.
+    # generate_series produces every bucket start, so empty buckets still come back as 0 rows.
+    bucket_count, bucket_width = TUTOR_TREND_BUCKETS[period]
+    if bucket_width == timedelta(days=1):
+        # Daily buckets end at the next midnight so today is the last bucket
+        buckets_end = now.replace(hour=0, minute=0, second=0, microsecond=0) + bucket_width
+    else:
+        buckets_end = now
+    buckets_start = buckets_end - bucket_count * bucket_width
+    
+    buckets = func.generate_series(
+        buckets_start, buckets_end - bucket_width, bucket_width
+    ).table_valued(column("bucket_start", DateTime)).render_derived(name="buckets")
+    bucket_start = buckets.c.bucket_start
+    trend_query = (
+        select(
+            func.to_char(bucket_start, "MM/DD").label("label"),
+            # Outer join: count matched enrollments via a column the index holds
+            func.count(Enrollment.enrollment_date).label("enrollments"),
+            paid_revenue.label("revenue"),
         )
-        total_revenue = float(revenue_result.scalar() or 0)
-        
-        return {
-            "total_organizations": total_organizations,
-            "active_organizations": active_organizations,
-            "new_organizations_this_month": new_organizations_this_month,
-            "total_users": total_users,
-            "total_courses": total_courses,
-            "total_revenue": total_revenue
+        .select_from(buckets)
+        # Enrollment filters live in the ON clause so the outer join keeps empty buckets
+        .outerjoin(Enrollment, and_(
+            *enrollment_filters,
+            Enrollment.enrollment_date >= bucket_start,
+            Enrollment.enrollment_date < bucket_start + bucket_width
+        ))
+        .group_by(bucket_start)
+        .order_by(bucket_start)
+    )
+    
+    # Per-course enrollment, completion and revenue totals; each consumer
+    # below orders and limits it in SQL so only the rows returned are built
+    course_enrollments = func.count()
+    course_stats_query = (
+        select(
+            Course.id,
+            Course.title,
+            # Chart label: titles over 20 characters are cut to 20 plus "..."
+            case(
+                (func.length(Course.title) > 20, func.concat(func.substr(Course.title, 1, 20), "...")),
+                else_=Course.title
+            ).label("short_title"),
+            course_enrollments.label("enrollments"),
+            func.count().filter(is_completed).label("completed"),
+            paid_revenue.label("revenue"),
+        )
+        .select_from(Enrollment)
+        .join(Course, Course.id == Enrollment.course_id)
+        .where(*enrollment_filters)
+        .group_by(Course.id)
+    )
+    # Course performance: the tutor's first 10 courses with enrollments
+    performance_query = course_stats_query.order_by(Course.id).limit(10)
+    # Top 5 courses by enrollments
+    top_courses_query = course_stats_query.order_by(course_enrollments.desc(), Course.id).limit(5)
+    
+    # Top students (by completion rate) with their names, ranked and limited in SQL.
+    # Grouping by the users primary key lets the name columns be selected directly.
+    student_completion_rate = func.count().filter(is_completed) * 100.0 / func.count()
+    top_students_query = (
+        select(
+            User.id,
+            User.first_name,
+            User.last_name,
+            func.count().label("enrollments"),
+            student_completion_rate.label("completion_rate"),
+            func.avg(func.coalesce(Enrollment.progress_percentage, 0)).label("average_progress"),
+        )
+        .select_from(Enrollment)
+        .join(User, User.id == Enrollment.student_id)
+        .where(*enrollment_filters)
+        .group_by(User.id)
+        # The student id breaks ties, so the response (and its ETag) is stable
+        .order_by(student_completion_rate.desc(), User.id)
+        .limit(5)
+    )
+    
+    # The aggregates are independent, so run them concurrently on separate
+    # pooled connections (bounded by _analytics_query_slots)
+    (
+        overview_rows,
+        students_rows,
+        trend_rows,
+        performance_rows,
+        top_course_rows,
+        top_student_rows,
+    ) = await asyncio.gather(
+        _fetch_all(overview_query),
+        _fetch_all(students_query),
+        _fetch_all(trend_query),
+        _fetch_all(performance_query),
+        _fetch_all(top_courses_query),
+        _fetch_all(top_students_query),
+    )
+    
+    overview = overview_rows[0]
+    total_courses = overview.total_courses
+    total_enrollments = overview.total_enrollments
+    active_students = overview.active_students
+    total_revenue = float(overview.total_revenue)
+    average_completion_rate = (overview.completed / total_enrollments * 100) if total_enrollments > 0 else 0
+    total_students = students_rows[0][0] or 0
+    
+    # Calculate growth (compare with previous period); both counts are 0 for "all"
+    previous_courses_count = overview.previous_courses
+    previous_enrollments_count = overview.previous_enrollments
+    course_growth = ((total_courses - previous_courses_count) / previous_courses_count * 100) if previous_courses_count > 0 else 0
+    enrollment_growth = ((total_enrollments - previous_enrollments_count) / previous_enrollments_count * 100) if previous_enrollments_count > 0 else 0
+    
+    enrollment_trend_labels = [row.label for row in trend_rows]
+    enrollment_trend_data = [row.enrollments for row in trend_rows]
+    revenue_trend_data = [float(row.revenue) for row in trend_rows]
+    
+    # Revenue trend shares the enrollment trend buckets
+    revenue_trend_labels = enrollment_trend_labels.copy()
+    
+    # Course performance data
+    course_performance_labels = []
+    course_performance_data = []
+    for stats in performance_rows:
+        completion_rate = stats.completed / stats.enrollments * 100
+        course_performance_labels.append(stats.short_title)
+        course_performance_data.append(round(completion_rate, 1))
+    
+    student_distribution_labels = ["Completed", "In Progress", "Not Started"]
+    student_distribution_data = [overview.completed, overview.in_progress, overview.not_started]
+    
+    top_courses = [
+        {
+            "id": stats.id,
+            "title": stats.title,
+            "enrollments": stats.enrollments,
+            "completion_rate": round(stats.completed / stats.enrollments * 100, 1),
+            "revenue": round(float(stats.revenue), 2)
         }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving platform stats: {str(e)}")
+        for stats in top_course_rows
+    ]
+    
+    top_students = [
+        {
+            "id": row.id,
+            "name": f"{row.first_name} {row.last_name}".strip() or f"Student {row.id}",
+            "courses_enrolled": row.enrollments,
+            "completion_rate": round(float(row.completion_rate), 1),
+            "total_progress": round(float(row.average_progress), 1)
+        }
+        for row in top_student_rows
+    ]
+    
+    return {
+        "overview": {
+            "total_courses": total_courses,
+            "total_students": total_students,
+            "total_enrollments": total_enrollments,
+            "total_revenue": round(total_revenue, 2),
+            "average_completion_rate": round(average_completion_rate, 1),
+            "active_students": active_students,
+            "course_growth": round(course_growth, 1),
+            "enrollment_growth": round(enrollment_growth, 1)
+        },
+        "enrollment_trend": {
+            "labels": enrollment_trend_labels,
+            "data": enrollment_trend_data
+        },
+        "course_performance": {
+            "labels": course_performance_labels,
+            "data": course_performance_data
+        },
+        "revenue_trend": {
+            "labels": revenue_trend_labels,
+            "data": revenue_trend_data
+        },
+        "student_distribution": {
+            "labels": student_distribution_labels,
+            "data": student_distribution_data
+        },
+        "top_courses": top_courses,
+        "top_students": top_students
+    }
 
 
 @router.get("/tutor")
 async def get_tutor_analytics(
+    request: Request,
     period: Optional[str] = Query("30d", description="Time period: 7d, 30d, 90d, all"),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(
+        require_roles("tutor", "instructor", detail="Only tutors and instructors can access tutor analytics")
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -93,261 +466,25 @@ async def get_tutor_analytics(
     Returns course performance, student progress, revenue, etc. for the current tutor
     """
     try:
-        # Check if user is tutor or instructor
-        if current_user.role not in ["tutor", "instructor"]:
-            raise HTTPException(status_code=403, detail="Only tutors and instructors can access tutor analytics")
-        
-        # Calculate date range based on period
-        now = datetime.now()
-        if period == "7d":
-            start_date = now - timedelta(days=7)
-        elif period == "30d":
-            start_date = now - timedelta(days=30)
-        elif period == "90d":
-            start_date = now - timedelta(days=90)
-        else:  # all
-            start_date = None
-        
-        # Get all courses created by this tutor from their organization
-        courses_query = select(Course).where(
-            and_(
-                Course.created_by == current_user.id,
-                Course.organization_id == current_user.organization_id
-            )
+        # Unknown periods are treated as "all", so they share its cache entry
+        if period not in TUTOR_ANALYTICS_PERIODS:
+            period = "all"
+        
+        # The aggregates use their own sessions; return the connection the role
+        # check checked out so this request holds at most one while they run
+        await db.close()
+        
+        tutor_analytics = await cache_service.get_or_compute_json(
+            tutor_analytics_cache_key(current_user.id, period),
+            TUTOR_ANALYTICS_CACHE_TTL,
+            lambda: _compute_tutor_analytics(current_user, period)
         )
-        if start_date:
-            courses_query = courses_query.where(Course.created_at >= start_date)
-        
-        courses_result = await db.execute(courses_query)
-        courses = courses_result.scalars().all()
-        course_ids = [course.id for course in courses]
-        
-        # Calculate overview stats
-        total_courses = len(courses)
-        
-        # Get enrollments for tutor's courses
-        # Handle case when there are no courses (empty course_ids list)
-        if course_ids:
-            enrollments_query = select(Enrollment).where(Enrollment.course_id.in_(course_ids))
-            if start_date:
-                enrollments_query = enrollments_query.where(Enrollment.enrollment_date >= start_date)
-            
-            enrollments_result = await db.execute(enrollments_query)
-            enrollments = enrollments_result.scalars().all()
-        else:
-            # No courses, so no enrollments
-            enrollments = []
-        
-        total_enrollments = len(enrollments)
-        
-        # Get ALL students in the tutor's organization (not just those with enrollments)
-        # This ensures we count all students, even if they haven't enrolled in courses yet
-        students_query = select(User).where(
-            and_(
-                User.organization_id == current_user.organization_id,
-                User.role == "student"
-            )
-        )
-        students_result = await db.execute(students_query)
-        all_students = students_result.scalars().all()
-        total_students = len(all_students)
-        
-        # Get unique students from enrollments (for enrollment-based metrics)
-        unique_student_ids = set([e.student_id for e in enrollments])
         
-        # Get active students (enrolled in last 30 days)
-        active_date = now - timedelta(days=30)
-        active_enrollments = [e for e in enrollments if e.enrollment_date >= active_date]
-        active_student_ids = set([e.student_id for e in active_enrollments])
-        active_students = len(active_student_ids)
-        
-        # Calculate revenue
-        total_revenue = sum([float(e.payment_amount or 0) for e in enrollments if e.payment_status == "paid"])
-        
-        # Calculate average completion rate
-        completed_enrollments = [e for e in enrollments if e.completion_date is not None]
-        average_completion_rate = (len(completed_enrollments) / total_enrollments * 100) if total_enrollments > 0 else 0
-        
-        # Calculate growth (compare with previous period)
-        if start_date:
-            previous_start = start_date - (now - start_date)
-            previous_courses_query = select(Course).where(
-                and_(
-                    Course.created_by == current_user.id,
-                    Course.organization_id == current_user.organization_id,
-                    Course.created_at >= previous_start,
-                    Course.created_at < start_date
-                )
-            )
-            previous_courses_result = await db.execute(previous_courses_query)
-            previous_courses = previous_courses_result.scalars().all()
-            previous_course_ids = [c.id for c in previous_courses]
-            
-            previous_enrollments_query = select(Enrollment).where(
-                and_(
-                    Enrollment.course_id.in_(previous_course_ids),
-                    Enrollment.enrollment_date >= previous_start,
-                    Enrollment.enrollment_date < start_date
-                )
-            )
-            previous_enrollments_result = await db.execute(previous_enrollments_query)
-            previous_enrollments = previous_enrollments_result.scalars().all()
-            
-            previous_courses_count = len(previous_courses)
-            previous_enrollments_count = len(previous_enrollments)
-            
-            course_growth = ((total_courses - previous_courses_count) / previous_courses_count * 100) if previous_courses_count > 0 else 0
-            enrollment_growth = ((total_enrollments - previous_enrollments_count) / previous_enrollments_count * 100) if previous_enrollments_count > 0 else 0
-        else:
-            course_growth = 0
-            enrollment_growth = 0
-        
-        # Generate enrollment trend data (last 7 days or period)
-        enrollment_trend_labels = []
-        enrollment_trend_data = []
-        
-        if period == "7d" or period == "30d":
-            days = 7 if period == "7d" else 30
-            for i in range(days - 1, -1, -1):
-                date = now - timedelta(days=i)
-                date_str = date.strftime("%m/%d")
-                enrollment_trend_labels.append(date_str)
-                
-                day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-                day_end = day_start + timedelta(days=1)
-                day_enrollments = [e for e in enrollments if day_start <= e.enrollment_date < day_end]
-                enrollment_trend_data.append(len(day_enrollments))
-        else:
-            # For 90d or all, group by weeks
-            weeks = 12 if period == "90d" else min(12, (now - (start_date or datetime(2020, 1, 1))).days // 7)
-            for i in range(weeks - 1, -1, -1):
-                week_start = now - timedelta(weeks=i+1)
-                week_end = now - timedelta(weeks=i)
-                week_str = week_start.strftime("%m/%d")
-                enrollment_trend_labels.append(week_str)
-                
-                week_enrollments = [e for e in enrollments if week_start <= e.enrollment_date < week_end]
-                enrollment_trend_data.append(len(week_enrollments))
-        
-        # Course performance data
-        course_performance_labels = []
-        course_performance_data = []
-        for course in courses[:10]:  # Top 10 courses
-            course_enrollments = [e for e in enrollments if e.course_id == course.id]
-            if course_enrollments:
-                completed = len([e for e in course_enrollments if e.completion_date is not None])
-                completion_rate = (completed / len(course_enrollments) * 100) if course_enrollments else 0
-                course_performance_labels.append(course.title[:20] + "..." if len(course.title) > 20 else course.title)
-                course_performance_data.append(round(completion_rate, 1))
-        
-        # Revenue trend (same as enrollment trend for now)
-        revenue_trend_labels = enrollment_trend_labels.copy()
-        revenue_trend_data = []
-        
-        if period == "7d" or period == "30d":
-            days = 7 if period == "7d" else 30
-            for i in range(days - 1, -1, -1):
-                date = now - timedelta(days=i)
-                day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-                day_end = day_start + timedelta(days=1)
-                day_enrollments = [e for e in enrollments if day_start <= e.enrollment_date < day_end and e.payment_status == "paid"]
-                revenue_trend_data.append(sum([float(e.payment_amount or 0) for e in day_enrollments]))
-        else:
-            weeks = 12 if period == "90d" else min(12, (now - (start_date or datetime(2020, 1, 1))).days // 7)
-            for i in range(weeks - 1, -1, -1):
-                week_start = now - timedelta(weeks=i+1)
-                week_end = now - timedelta(weeks=i)
-                week_enrollments = [e for e in enrollments if week_start <= e.enrollment_date < week_end and e.payment_status == "paid"]
-                revenue_trend_data.append(sum([float(e.payment_amount or 0) for e in week_enrollments]))
-        
-        # Student distribution (by completion status)
-        completed_count = len([e for e in enrollments if e.completion_date is not None])
-        in_progress_count = len([e for e in enrollments if e.completion_date is None and e.progress_percentage > 0])
-        not_started_count = len([e for e in enrollments if e.completion_date is None and e.progress_percentage == 0])
-        
-        student_distribution_labels = ["Completed", "In Progress", "Not Started"]
-        student_distribution_data = [completed_count, in_progress_count, not_started_count]
-        
-        # Top courses
-        top_courses = []
-        for course in courses:
-            course_enrollments = [e for e in enrollments if e.course_id == course.id]
-            if course_enrollments:
-                completed = len([e for e in course_enrollments if e.completion_date is not None])
-                completion_rate = (completed / len(course_enrollments) * 100) if course_enrollments else 0
-                course_revenue = sum([float(e.payment_amount or 0) for e in course_enrollments if e.payment_status == "paid"])
-                top_courses.append({
-                    "id": course.id,
-                    "title": course.title,
-                    "enrollments": len(course_enrollments),
-                    "completion_rate": round(completion_rate, 1),
-                    "revenue": round(course_revenue, 2)
-                })
-        
-        # Sort by enrollments and take top 5
-        top_courses.sort(key=lambda x: x["enrollments"], reverse=True)
-        top_courses = top_courses[:5]
-        
-        # Top students (by completion rate)
-        top_students = []
-        for student_id in unique_student_ids:
-            student_enrollments = [e for e in enrollments if e.student_id == student_id]
-            if student_enrollments:
-                completed = len([e for e in student_enrollments if e.completion_date is not None])
-                completion_rate = (completed / len(student_enrollments) * 100) if student_enrollments else 0
-                total_progress = sum([e.progress_percentage or 0 for e in student_enrollments]) / len(student_enrollments) if student_enrollments else 0
-                
-                # Get student name
-                student_result = await db.execute(select(User).where(User.id == student_id))
-                student = student_result.scalar_one_or_none()
-                student_name = f"{student.first_name} {student.last_name}".strip() if student else f"Student {student_id}"
-                
-                top_students.append({
-                    "id": student_id,
-                    "name": student_name,
-                    "courses_enrolled": len(student_enrollments),
-                    "completion_rate": round(completion_rate, 1),
-                    "total_progress": round(total_progress, 1)
-                })
-        
-        # Sort by completion rate and take top 5
-        top_students.sort(key=lambda x: x["completion_rate"], reverse=True)
-        top_students = top_students[:5]
-        
-        return {
-            "overview": {
-                "total_courses": total_courses,
-                "total_students": total_students,
-                "total_enrollments": total_enrollments,
-                "total_revenue": round(total_revenue, 2),
-                "average_completion_rate": round(average_completion_rate, 1),
-                "active_students": active_students,
-                "course_growth": round(course_growth, 1),
-                "enrollment_growth": round(enrollment_growth, 1)
-            },
-            "enrollment_trend": {
-                "labels": enrollment_trend_labels,
-                "data": enrollment_trend_data
-            },
-            "course_performance": {
-                "labels": course_performance_labels,
-                "data": course_performance_data
-            },
-            "revenue_trend": {
-                "labels": revenue_trend_labels,
-                "data": revenue_trend_data
-            },
-            "student_distribution": {
-                "labels": student_distribution_labels,
-                "data": student_distribution_data
-            },
-            "top_courses": top_courses,
-            "top_students": top_students
-        }
+        # Dashboards poll this endpoint; unchanged payloads are answered with a bodyless 304
+        return _cacheable_response(request, tutor_analytics, TUTOR_ANALYTICS_MAX_AGE)
         
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        app_logger.exception(f"❌ Error retrieving tutor analytics: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error retrieving tutor analytics: {str(e)}")
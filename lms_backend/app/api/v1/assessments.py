@@ -1,7 +1,7 @@
 """
 Assessments API endpoints
 """
-from typing import Optional, List, Any, Dict
+from typing import Optional, List
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
@@ -25,8 +25,8 @@ class AssessmentResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("", summary="Get assessments", response_model=List[Dict[str, Any]])
-@router.get("/", summary="Get assessments", response_model=List[Dict[str, Any]])
+@router.get("", summary="Get assessments", response_model=List[AssessmentResponse])
+@router.get("/", summary="Get assessments", response_model=List[AssessmentResponse])
 async def get_assessments(
     status: Optional[str] = Query(None, description="Filter by status (published, draft, etc.)"),
     current_user: User = Depends(get_current_user),
@@ -6,10 +6,12 @@ from fastapi import APIRouter, Depends, HTTPException, status, Body
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import Field, EmailStr
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from sqlalchemy.engine import Row
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_current_user_lite, require_super_admin
+from app.core.security import verify_password_async, get_password_hash_async
 from app.schemas.auth import (
     UserRegister, UserLogin, Token, RefreshToken, 
     PasswordReset, PasswordResetConfirm, ChangePassword,
@@ -23,26 +25,11 @@ from app.models.user import User
 router = APIRouter()
 
 # OAuth2 scheme for token authentication
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/v1/auth/login")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-@router.post("/test-email", response_model=dict)
-async def test_email(
-    email: EmailStr = Body(..., description="Email address to send test email to"),
-    current_user: User = Depends(get_current_user)
-):
-    """
-    Test email functionality (requires authentication)
-    """
-    # Only allow super admins to test emails
-    if current_user.role != "super_admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only super admins can test email functionality"
-        )
-    
-    test_subject = "Test Email - InfoFit LMS"
-    test_html = """
+# Static test email body, built once at import
+_TEST_EMAIL_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -76,10 +63,21 @@ async def test_email(
     </body>
     </html>
     """
+
+
+@router.post("/test-email", response_model=dict)
+async def test_email(
+    email: EmailStr = Body(..., description="Email address to send test email to"),
+    current_user: User = Depends(require_super_admin)
+):
+    """
+    Test email functionality (super admins only)
+    """
+    test_subject = "Test Email - InfoFit LMS"
     
     test_text = "Test Email - InfoFit LMS\n\nThis is a test email to verify that the email service is working correctly.\n\nIf you're reading this, the email service is properly configured."
     
-    email_sent = await email_service.send_email(str(email), test_subject, test_html, test_text)
+    email_sent = await email_service.send_email(str(email), test_subject, _TEST_EMAIL_HTML, test_text)
     
     if email_sent:
         return {
@@ -114,9 +112,9 @@ async def send_registration_otp(
     
     # Check if user already exists
     existing_user = await db.execute(
-        select(User).where(User.email == str(email))
+        select(exists().where(User.email == str(email)))
     )
-    if existing_user.scalar_one_or_none():
+    if existing_user.scalar():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email already exists"
@@ -185,8 +183,7 @@ async def register(
                 detail="Invalid or expired OTP code. Please request a new OTP."
             )
     
-    auth_service = AuthService(db)
-    result = await auth_service.register_user(user_data)
+    result = await AuthService.register_user(db, user_data)
     return {
         "message": "User registered successfully",
         "data": result
@@ -201,8 +198,7 @@ async def register_organization(
     """
     Register a new organization with admin user
     """
-    auth_service = AuthService(db)
-    result = await auth_service.register_organization(org_data)
+    result = await AuthService.register_organization(db, org_data)
     return {
         "message": "Organization registered successfully",
         "data": result
@@ -217,9 +213,8 @@ async def login(
     """
     Login user and return access token
     """
-    auth_service = AuthService(db)
     user_data = UserLogin(email=form_data.username, password=form_data.password)
-    result = await auth_service.authenticate_user(user_data)
+    result = await AuthService.authenticate_user(db, user_data)
     return {
         "message": "Login successful",
         "data": result
@@ -234,8 +229,7 @@ async def refresh_token(
     """
     Refresh access token using refresh token
     """
-    auth_service = AuthService(db)
-    result = await auth_service.refresh_token(refresh_data.refresh_token)
+    result = await AuthService.refresh_token(db, refresh_data.refresh_token)
     return {
         "message": "Token refreshed successfully",
         "data": result
@@ -255,8 +249,7 @@ async def logout():
 
 @router.post("/forgot-password", response_model=dict)
 async def forgot_password(
-    password_reset: PasswordReset,
-    db: AsyncSession = Depends(get_db)
+    password_reset: PasswordReset
 ):
     """
     Request password reset
@@ -270,8 +263,7 @@ async def forgot_password(
 
 @router.post("/reset-password", response_model=dict)
 async def reset_password(
-    password_reset: PasswordResetConfirm,
-    db: AsyncSession = Depends(get_db)
+    password_reset: PasswordResetConfirm
 ):
     """
     Reset password using token
@@ -292,17 +284,15 @@ async def change_password(
     """
     Change user password
     """
-    auth_service = AuthService(db)
-    
     # Verify current password
-    if not auth_service.verify_password(password_data.current_password, current_user.hashed_password):
+    if not await verify_password_async(password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
     # Update password
-    new_hashed_password = auth_service.get_password_hash(password_data.new_password)
+    new_hashed_password = await get_password_hash_async(password_data.new_password)
     current_user.hashed_password = new_hashed_password
     await db.commit()
     
@@ -317,7 +307,7 @@ async def change_password(
 
 @router.get("/me", response_model=dict)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user_lite)
 ):
     """
     Get current user information
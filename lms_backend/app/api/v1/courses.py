@@ -1,15 +1,17 @@
 """
 Course API endpoints for the LMS application
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-import math
+from sqlalchemy import select, inspect as sa_inspect
+import base64
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, get_optional_current_user
 from app.core.errors import ResourceNotFoundError, AuthorizationError
+from app.core.logging import app_logger
 # from app.core.rbac import require_permission, require_role  # Temporarily disabled
 from app.models.user import User
 from app.schemas.course import (
@@ -22,11 +24,39 @@ from app.schemas.course import (
     CourseInstructorCreate, CourseInstructorUpdate, CourseInstructorResponse,
     BulkEnrollmentCreate, BulkEnrollmentResponse, EnrollmentAnalytics
 )
-from app.models.course import CourseStatus
+from app.models.course import Course, Enrollment
 from app.services.course import CourseService, TopicService, LessonService, EnrollmentService, LessonAttachmentService, CourseInstructorService
+from app.services.analytics_cache import invalidate_analytics_cache, invalidate_course_analytics
 
 router = APIRouter()
 
+# Roles allowed to enroll students other than themselves
+STAFF_ROLES = frozenset({"instructor", "tutor", "organization_admin", "super_admin"})
+
+
+def _encode_course_cursor(course: Course) -> str:
+    """Encode the (created_at, id) position of a course as an opaque cursor"""
+    position = f"{course.created_at.isoformat()}|{course.id}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def _decode_course_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by _encode_course_cursor"""
+    try:
+        created_at, course_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(course_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _course_detail_payload(course: Course, **extras) -> dict:
+    """
+    A course's mapped columns plus extras, as a dict for the CourseDetail
+    response_model (which validates it once when serializing the response)
+    """
+    columns = {attr.key: getattr(course, attr.key) for attr in sa_inspect(course).mapper.column_attrs}
+    return {**columns, **extras}
+
 
 # Course Management Endpoints
 @router.post("/", response_model=CourseResponse, status_code=status.HTTP_201_CREATED)
@@ -38,6 +68,7 @@ async def create_course(
 ):
     """Create a new course"""
     course = await CourseService.create_course(db, course_data, current_user.id)
+    await invalidate_analytics_cache(course.created_by)
     return course
 
 
@@ -55,10 +86,13 @@ async def get_courses(
     organization_id: Optional[int] = Query(None, description="Filter by organization"),
     category: Optional[str] = Query(None, description="Filter by category"),
     is_featured: Optional[bool] = Query(None, description="Filter by featured status"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (alternative to page/skip)"),
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get courses with filtering and pagination"""
+    course_cursor = _decode_course_cursor(cursor) if cursor else None
+    
     try:
         # Use skip/limit if provided, otherwise calculate from page/size
         if skip is not None and limit is not None:
@@ -68,27 +102,6 @@ async def get_courses(
             actual_skip = (page - 1) * size
             actual_limit = size
         
-        # Convert status string to CourseStatus enum if provided
-        status_enum = None
-        if status:
-            try:
-                # Normalize status to lowercase for comparison
-                status_lower = status.lower().strip()
-                # Try to match enum value
-                for enum_member in CourseStatus:
-                    if enum_member.value.lower() == status_lower:
-                        status_enum = enum_member
-                        break
-                # If no match found, try direct conversion
-                if status_enum is None:
-                    status_enum = CourseStatus(status_lower)
-            except (ValueError, AttributeError) as e:
-                # Invalid status value, will be ignored
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"Invalid status value '{status}', ignoring filter: {str(e)}")
-                pass
-        
         # Auto-filter by organization and created_by for tutors
         # Tutors can only see courses from their organization that they created
         actual_organization_id = organization_id
@@ -109,16 +122,29 @@ async def get_courses(
             difficulty_level=difficulty_level,
             min_price=min_price,
             max_price=max_price,
-            status=status_enum,
+            status=status,  # Normalized to CourseStatus by CourseFilter
             organization_id=actual_organization_id,
             category=category,
             is_featured=is_featured,
             created_by=created_by
         )
         
-        courses, total = await CourseService.get_courses(db, actual_skip, actual_limit, filters)
+        courses, total = await CourseService.get_courses(
+            db, actual_skip, actual_limit, filters, cursor=course_cursor
+        )
+        
+        # A full page may have more after it; hand back where it ended
+        next_cursor = _encode_course_cursor(courses[-1]) if len(courses) == actual_limit else None
+        
+        if course_cursor is not None:
+            return CourseListResponse(
+                courses=courses,
+                page=1,
+                size=actual_limit,
+                next_cursor=next_cursor
+            )
         
-        pages = math.ceil(total / actual_limit) if total > 0 else 0
+        pages = (total + actual_limit - 1) // actual_limit if total > 0 else 0
         current_page = (actual_skip // actual_limit) + 1 if actual_limit > 0 else 1
         
         return CourseListResponse(
@@ -126,14 +152,11 @@ async def get_courses(
             total=total,
             page=current_page,
             size=actual_limit,
-            pages=pages
+            pages=pages,
+            next_cursor=next_cursor
         )
     except Exception as e:
-        import logging
-        import traceback
-        logger = logging.getLogger(__name__)
-        error_traceback = traceback.format_exc()
-        logger.error(f"Error retrieving courses: {str(e)}\n{error_traceback}")
+        app_logger.exception(f"❌ Error retrieving courses: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"Error retrieving courses: {str(e)}"
@@ -147,9 +170,10 @@ async def get_course(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a course by ID with all details"""
-    course = await CourseService.get_course_with_details(db, course_id)
-    if not course:
+    row = await CourseService.get_course_detail(db, course_id)
+    if not row:
         raise HTTPException(status_code=404, detail="Course not found")
+    course, organization, primary_instructor, total_lessons, enrollment_count = row
     
     # Check permissions: tutors can only view their own courses from their organization
     if current_user:
@@ -166,39 +190,21 @@ async def get_course(
                     detail="You don't have permission to view this course"
                 )
     
-    # Calculate additional stats
-    total_lessons = sum(len(topic.lessons) for topic in course.topics)
-    enrollment_count = len(course.enrollments)
-    
-    # Get primary instructor
-    primary_instructor = None
-    if course.instructors:
-        # Find primary instructor or use the first one
-        primary_instructor = next(
-            (inst.instructor for inst in course.instructors if inst.is_primary), 
-            course.instructors[0].instructor if course.instructors else None
-        )
-    
-    # Create course detail response - exclude conflicting fields from __dict__
-    course_dict = course.__dict__.copy()
-    course_dict.update({
-        'total_lessons': total_lessons,  # Update with calculated value
-        'enrollment_count': enrollment_count,
-        'instructor': {
+    return _course_detail_payload(
+        course,
+        total_lessons=total_lessons,
+        enrollment_count=enrollment_count,
+        instructor={
             "id": primary_instructor.id,
             "name": f"{primary_instructor.first_name} {primary_instructor.last_name}",
             "email": primary_instructor.email
         } if primary_instructor else None,
-        'organization': {
-            "id": course.organization.id,
-            "name": course.organization.name,
-            "description": course.organization.description
-        } if course.organization else None
-    })
-    
-    course_detail = CourseDetail(**course_dict)
-    
-    return course_detail
+        organization={
+            "id": organization.id,
+            "name": organization.name,
+            "description": organization.description
+        } if organization else None
+    )
 
 
 @router.put("/{course_id}", response_model=CourseResponse)
@@ -211,6 +217,7 @@ async def update_course(
 ):
     """Update a course"""
     course = await CourseService.update_course(db, course_id, course_data, current_user.id)
+    await invalidate_analytics_cache(course.created_by)
     return course
 
 
@@ -223,14 +230,16 @@ async def delete_course(
 ):
     """Delete a course"""
     try:
+        # Look up the creator first; their cached analytics still count this course
+        created_by = await db.scalar(select(Course.created_by).where(Course.id == course_id))
         await CourseService.delete_course(db, course_id, current_user.id)
+        await invalidate_analytics_cache(created_by)
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except AuthorizationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        app_logger.exception(f"❌ Error deleting course {course_id}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete course: {str(e)}"
@@ -247,6 +256,7 @@ async def set_course_pricing(
 ):
     """Set course pricing"""
     course = await CourseService.set_course_pricing(db, course_id, pricing_data, current_user.id)
+    await invalidate_analytics_cache(course.created_by)
     return course
 
 
@@ -259,6 +269,7 @@ async def publish_course(
 ):
     """Publish a course"""
     course = await CourseService.publish_course(db, course_id, current_user.id)
+    await invalidate_analytics_cache(course.created_by)
     return course
 
 
@@ -271,6 +282,7 @@ async def archive_course(
 ):
     """Archive a course"""
     course = await CourseService.archive_course(db, course_id, current_user.id)
+    await invalidate_analytics_cache(course.created_by)
     return course
 
 
@@ -297,23 +309,16 @@ async def create_topic(
 ):
     """Create a new topic for a course"""
     try:
-        print(f"🔍 Creating topic for course {course_id}")
-        print(f"📝 Topic data received: {topic_data}")
-        print(f"👤 Current user: {current_user.id}")
+        app_logger.debug(f"🔍 Creating topic for course {course_id} by user {current_user.id}: {topic_data}")
         
         # Pass course_id directly to service since it's not in TopicCreate schema
-        print(f"📋 Topic create data: {topic_data}")
-        
         topic = await TopicService.create_topic(db, topic_data, course_id, current_user.id)
         
-        print(f"✅ Topic created successfully: {topic.id}")
+        app_logger.debug(f"✅ Topic created successfully: {topic.id}")
         return topic
         
     except Exception as e:
-        print(f"❌ Error creating topic: {str(e)}")
-        print(f"🔍 Error type: {type(e)}")
-        import traceback
-        traceback.print_exc()
+        app_logger.exception(f"❌ Error creating topic: {str(e)}")
         raise e
 
 
@@ -323,11 +328,8 @@ async def get_course_topics(
     db: AsyncSession = Depends(get_db)
 ):
     """Get all topics for a course"""
-    print(f"🔍 Getting topics for course {course_id}")
     topics = await TopicService.get_course_topics(db, course_id)
-    print(f"📚 Found {len(topics)} topics for course {course_id}")
-    for topic in topics:
-        print(f"  - Topic {topic.id}: {topic.title} with {len(topic.lessons)} lessons")
+    app_logger.debug(f"📚 Found {len(topics)} topics for course {course_id}")
     return topics
 
 
@@ -337,18 +339,11 @@ async def get_topic_with_lessons(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a topic with all its lessons"""
-    topic = await TopicService.get_topic(db, topic_id)
+    topic = await TopicService.get_topic_with_lessons(db, topic_id)
     if not topic:
         raise HTTPException(status_code=404, detail="Topic not found")
     
-    lessons = await LessonService.get_topic_lessons(db, topic_id)
-    
-    topic_with_lessons = TopicWithLessons(
-        **topic.__dict__,
-        lessons=lessons
-    )
-    
-    return topic_with_lessons
+    return topic
 
 
 @router.put("/topics/{topic_id}", response_model=TopicResponse)
@@ -446,45 +441,32 @@ async def enroll_in_course(
     current_user: User = Depends(get_current_user)
 ):
     """Enroll current user or specified student in a course"""
-    print(f"🔍 Enrollment request - Course ID: {course_id}, Student ID: {student_id}, Current User: {current_user.id}")
-    
     # Use provided student_id or current user's id
     target_student_id = student_id if student_id else current_user.id
-    print(f"🎯 Target student ID: {target_student_id}")
     
     # If enrolling someone else, check permissions
     if student_id and student_id != current_user.id:
-        print(f"🔐 Checking permissions for user {current_user.id} with role {current_user.role}")
         # Check if current user is instructor, tutor, or admin
-        if current_user.role not in ["instructor", "tutor", "organization_admin", "super_admin"]:
-            print(f"❌ Permission denied for role: {current_user.role}")
+        if current_user.role not in STAFF_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to enroll other students"
             )
-        print(f"✅ Permission granted for role: {current_user.role}")
     
     try:
-        print(f"📝 Calling EnrollmentService.enroll_in_course with course_id={course_id}, student_id={target_student_id}")
         enrollment = await EnrollmentService.enroll_in_course(db, course_id, target_student_id)
-        print(f"✅ Enrollment created: {enrollment.id}")
+        app_logger.debug(f"✅ Enrollment {enrollment.id} created: course {course_id}, student {target_student_id}")
+        await invalidate_course_analytics(db, course_id)
         
         # Convert to response model to ensure proper serialization
-        from app.schemas.course import EnrollmentResponse
         try:
-            enrollment_response = EnrollmentResponse.model_validate(enrollment)
-            print(f"✅ Enrollment response serialized successfully")
-            return enrollment_response
+            return EnrollmentResponse.model_validate(enrollment)
         except Exception as serialization_error:
-            print(f"⚠️ Error serializing enrollment response: {str(serialization_error)}")
-            import traceback
-            traceback.print_exc()
+            app_logger.exception(f"⚠️ Error serializing enrollment response: {str(serialization_error)}")
             # Return enrollment anyway - FastAPI will handle serialization
             return enrollment
     except Exception as e:
-        print(f"❌ Error in enroll_in_course endpoint: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        app_logger.exception(f"❌ Error in enroll_in_course endpoint: {str(e)}")
         # Re-raise the exception so it's handled by the exception handler
         raise
 
@@ -499,8 +481,7 @@ async def get_course_enrollments(
     current_user: User = Depends(get_current_user)
 ):
     """Get enrollments for a course (instructor/organization admin only)"""
-    enrollments, _ = await EnrollmentService.get_course_enrollments(db, course_id, skip, limit)
-    return enrollments
+    return await EnrollmentService.get_course_enrollment_rows(db, course_id, skip, limit)
 
 
 @router.put("/enrollments/{enrollment_id}", response_model=EnrollmentResponse)
@@ -513,6 +494,7 @@ async def update_enrollment(
 ):
     """Update an enrollment"""
     enrollment = await EnrollmentService.update_enrollment(db, enrollment_id, enrollment_data)
+    await invalidate_course_analytics(db, enrollment.course_id)
     return enrollment
 
 
@@ -524,7 +506,9 @@ async def cancel_enrollment(
     current_user: User = Depends(get_current_user)
 ):
     """Cancel an enrollment"""
+    course_id = await db.scalar(select(Enrollment.course_id).where(Enrollment.id == enrollment_id))
     await EnrollmentService.cancel_enrollment(db, enrollment_id)
+    await invalidate_course_analytics(db, course_id)
 
 
 # Lesson Attachment Management Endpoints
@@ -714,6 +698,7 @@ async def bulk_enroll_students(
 ):
     """Bulk enroll students in a course"""
     result = await EnrollmentService.bulk_enroll_students(db, course_id, bulk_data, current_user.id)
+    await invalidate_course_analytics(db, course_id)
     return result
 
 
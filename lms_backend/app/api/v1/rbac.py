@@ -5,9 +5,9 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, require_super_admin
 from app.core.permissions import (
-    require_super_admin, require_organization_admin,
+    require_organization_admin,
     require_permission, get_user_permissions
 )
 from app.models.user import User
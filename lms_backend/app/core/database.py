@@ -17,11 +17,16 @@ if settings.DATABASE_URL.startswith("postgresql"):
 else:
     database_url = settings.DATABASE_URL
 
+# Hot-path statements (login, /me) are cached compiled by SQLAlchemy and
+# server-side prepared by psycopg after repeated execution on a connection
 engine = create_async_engine(
     database_url,
     echo=settings.DATABASE_ECHO,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_pre_ping=True,
     pool_recycle=300,
+    query_cache_size=1200,
 )
 
 # Create async session factory
@@ -4,6 +4,8 @@ Dependency injection utilities for FastAPI
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -13,13 +15,22 @@ from app.models.user import User
 # Security scheme for JWT tokens
 security = HTTPBearer()
 
+# Columns returned by get_current_user_lite
+USER_PROFILE_COLUMNS = (
+    User.id,
+    User.email,
+    User.first_name,
+    User.last_name,
+    User.role,
+    User.organization_id,
+    User.is_active,
+    User.created_at,
+)
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
+
+def _user_id_from_credentials(credentials: HTTPAuthorizationCredentials) -> int:
     """
-    Get current authenticated user
+    Validate the bearer token and return the user ID it was issued for
     """
     token = credentials.credentials
     user_id = verify_token(token)
@@ -31,16 +42,27 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Get user from database - convert string user_id to integer
+    # Convert string user_id to integer
     try:
-        user_id_int = int(user_id)
+        return int(user_id)
     except (ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user ID in token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Get current authenticated user
+    """
+    user_id_int = _user_id_from_credentials(credentials)
     
+    # Get user from database
     user = await User.get_by_id(db, user_id_int)
     if user is None:
         raise HTTPException(
@@ -52,6 +74,32 @@ async def get_current_user(
     return user
 
 
+async def get_current_user_lite(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> Row:
+    """
+    Get the current user's profile columns as a read-only row
+    
+    For endpoints that only read the profile; the row has the same attribute
+    names as User but is never loaded into the session.
+    """
+    user_id_int = _user_id_from_credentials(credentials)
+    
+    result = await db.execute(
+        select(*USER_PROFILE_COLUMNS).where(User.id == user_id_int)
+    )
+    user = result.one_or_none()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return user
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -108,6 +156,29 @@ async def get_current_admin(
     return current_user
 
 
+def require_roles(*roles: str, detail: str = "You don't have permission to access this resource"):
+    """
+    Build a dependency that returns the current user only if their role is one of roles,
+    so forbidden requests are rejected before the endpoint does any work
+    """
+    allowed_roles = frozenset(roles)
+    
+    async def dependency(current_user: User = Depends(get_current_user)) -> User:
+        if current_user.role not in allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+            )
+        return current_user
+    
+    return dependency
+
+
+# Checked against the stored role, not the token's role claim: the claim is only
+# as fresh as the token, so a promotion or demotion would lag until it expires
+require_super_admin = require_roles("super_admin", detail="Only super admins can access this resource")
+
+
 async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: AsyncSession = Depends(get_db)
@@ -7,6 +7,7 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.logging import app_logger
 from app.core.config import settings
@@ -306,6 +307,34 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
     )
 
 
+async def database_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+    """Handle database exceptions raised by endpoints that don't catch them"""
+    app_logger.error(
+        "Database Exception: {}".format(str(exc)),
+        extra={
+            "path": request.url.path,
+            "method": request.method,
+            "exception_type": type(exc).__name__,
+        },
+        exc_info=True,
+    )
+    
+    # Add CORS headers
+    headers = get_cors_headers(request)
+    
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "error": {
+                "code": "DB_ERROR",
+                "message": "Database error occurred",
+                "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            }
+        },
+        headers=headers,
+    )
+
+
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle general exceptions"""
     app_logger.error(
@@ -342,6 +371,7 @@ def setup_exception_handlers(app):
     app.add_exception_handler(HTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(ValidationError, pydantic_validation_exception_handler)
+    app.add_exception_handler(SQLAlchemyError, database_exception_handler)
     app.add_exception_handler(Exception, general_exception_handler)
     
     # Register custom exception handlers
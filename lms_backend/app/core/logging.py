@@ -83,12 +83,16 @@ def setup_logging():
     # Remove default logger
     logger.remove()
     
+    # Sinks are enqueued so formatting and I/O happen on loguru's writer
+    # thread instead of blocking the event loop that emitted the record
+    
     # Add console handler
     logger.add(
         sys.stderr,
         format=LogConfig().LOG_FORMAT,
         level=LogConfig().LOG_LEVEL,
         colorize=True,
+        enqueue=True,
     )
     
     # Add file handler
@@ -99,6 +103,7 @@ def setup_logging():
         rotation="10 MB",
         retention="7 days",
         compression="zip",
+        enqueue=True,
     )
     
     # Intercept standard logging
@@ -103,7 +103,7 @@ def require_any_role(*role_names: str):
 
 
 # Predefined permission checkers for common operations
-require_super_admin = require_role("super_admin")
+# (require_super_admin lives in app.core.dependencies)
 require_organization_admin = require_role("organization_admin")
 require_tutor = require_role("tutor")
 require_student = require_role("student")
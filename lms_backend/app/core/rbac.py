@@ -72,13 +72,6 @@ def require_role(role_name: str):
     return decorator
 
 
-def require_super_admin():
-    """
-    Decorator to require super admin role
-    """
-    return require_role("super_admin")
-
-
 def require_organization_admin():
     """
     Decorator to require organization admin role
@@ -1,9 +1,12 @@
 """
 Security utilities for authentication and authorization
 """
+import asyncio
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Union, Optional
-from jose import jwt, JWTError
+from jose import jwt, JWTError, ExpiredSignatureError
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
 
@@ -49,12 +52,37 @@ def create_refresh_token(
     return encoded_jwt
 
 
+@lru_cache(maxsize=10000)
+def _decode_token_signature(token: str) -> dict:
+    """
+    Verify the token signature and return its claims (cached per token string)
+    """
+    return jwt.decode(
+        token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM],
+        options={"verify_exp": False}
+    )
+
+
+def decode_token(token: str) -> dict:
+    """
+    Decode a JWT, raising JWTError if it is invalid or expired
+    
+    The same token is sent on every request of a session, so the signature
+    check is cached; expiry is still checked on every call.
+    """
+    payload = _decode_token_signature(token)
+    exp = payload.get("exp")
+    if exp is not None and time.time() > exp:
+        raise ExpiredSignatureError("Signature has expired.")
+    return payload
+
+
 def verify_token(token: str) -> Optional[str]:
     """
     Verify JWT token and return subject
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         subject: str = payload.get("sub")
         if subject is None:
             return None
@@ -77,6 +105,23 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# sha256_crypt runs hundreds of thousands of rounds per call, so async code
+# hashes and verifies in a worker thread instead of blocking the event loop
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify password against hash without blocking the event loop
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash password without blocking the event loop
+    """
+    return await asyncio.to_thread(get_password_hash, password)
+
+
 def create_tokens(user_id: str) -> dict:
     """
     Create both access and refresh tokens
@@ -104,7 +149,7 @@ def verify_refresh_token(token: str) -> Optional[str]:
     Verify refresh token specifically
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         subject: str = payload.get("sub")
         token_type: str = payload.get("type")
         
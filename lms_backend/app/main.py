@@ -14,6 +14,7 @@ from app.core.config import settings
 from app.core.database import init_db, close_db, get_db
 from app.core.logging import app_logger
 from app.core.errors import setup_exception_handlers, get_cors_headers
+from app.services.cache_service import cache_service
 from app.api.v1 import auth, rbac, courses, users, upload, analytics, organizations, assessments, contact
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
@@ -45,6 +46,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         app_logger.error(f"❌ Error closing database connections: {str(e)}")
     
+    try:
+        await cache_service.close()
+    except Exception as e:
+        app_logger.error(f"❌ Error closing cache connections: {str(e)}")
+    
     app_logger.info("✅ LMS API shutdown complete")
 
 
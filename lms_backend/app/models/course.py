@@ -1,7 +1,7 @@
 """
 Course Management Models
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, ForeignKey, Float, Date, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, ForeignKey, Float, Date, Enum, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -30,6 +30,17 @@ class Course(Base):
     Course model - Main course entity
     """
     __tablename__ = "courses"
+    __table_args__ = (
+        # Tutor analytics: a tutor's courses within their organization
+        Index("idx_courses_creator", "created_by", "organization_id", text("created_at DESC")),
+        # Course listings: newest first, keyset pagination on (created_at, id)
+        Index("idx_courses_created_id", text("created_at DESC"), text("id DESC")),
+        # Filtered course listings: status and organization equality, newest first
+        Index(
+            "idx_courses_status_org_created",
+            "status", "organization_id", text("created_at DESC"), text("id DESC")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -227,6 +238,23 @@ class Enrollment(Base):
     Student course enrollments
     """
     __tablename__ = "enrollments"
+    __table_args__ = (
+        # Paid-revenue SUM in platform stats
+        Index(
+            "idx_enrollments_paid",
+            "payment_amount",
+            postgresql_where=text("payment_status = 'paid' AND payment_amount IS NOT NULL"),
+        ),
+        # Tutor analytics aggregates (count(*) plus the INCLUDE columns), answered by index-only scans
+        Index(
+            "idx_enrollments_course_date",
+            "course_id",
+            text("enrollment_date DESC"),
+            postgresql_include=[
+                "payment_status", "payment_amount", "completion_date", "progress_percentage", "student_id"
+            ],
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
@@ -1,7 +1,7 @@
 """
 Organization model for the LMS application
 """
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -13,6 +13,9 @@ class Organization(Base):
     Organization model
     """
     __tablename__ = "organizations"
+    __table_args__ = (
+        Index("idx_orgs_created_at", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -1,7 +1,7 @@
 """
 OTP (One-Time Password) model for email verification
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -13,9 +13,14 @@ class OTP(Base):
     OTP model for email verification during registration
     """
     __tablename__ = "otps"
+    __table_args__ = (
+        # Lookups filter by (email, purpose); verification probes unverified codes
+        Index("idx_otps_email_purpose", "email", "purpose"),
+        Index("idx_otps_active_code", "code", postgresql_where=text("is_verified = false")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    email = Column(String(255), nullable=False, index=True)
+    email = Column(String(255), nullable=False)
     code = Column(String(6), nullable=False)  # 6-digit OTP code
     purpose = Column(String(50), nullable=False, default="registration")  # registration, password_reset, etc.
     is_verified = Column(Boolean, default=False)
@@ -105,12 +105,19 @@ class CourseResponse(CourseBase):
 
 
 class CourseListResponse(BaseModel):
-    """Schema for paginated course list response"""
+    """
+    Schema for paginated course list response
+    
+    Offset pages (page/size or skip/limit) report total, page and pages.
+    Cursor pages are not counted: total and pages are None and page is always 1.
+    Both set next_cursor when the page is full; pass it back as cursor to continue.
+    """
     courses: List[CourseResponse]
-    total: int
+    total: Optional[int] = None  # Not counted when paging by cursor
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # ============================================================================
@@ -374,6 +381,10 @@ class CourseReviewResponse(BaseModel):
 # COURSE FILTER SCHEMAS
 # ============================================================================
 
+# Case-insensitive course status filter values
+COURSE_STATUS_LOOKUP = {member.value.lower(): member for member in CourseStatus}
+
+
 class CourseFilter(BaseModel):
     """Schema for filtering courses"""
     search: Optional[str] = Field(None, description="Search term for title or description")
@@ -389,6 +400,14 @@ class CourseFilter(BaseModel):
     is_featured: Optional[bool] = None
     created_after: Optional[datetime] = None
     created_before: Optional[datetime] = None
+    
+    @field_validator('status', mode='before')
+    @classmethod
+    def normalize_status(cls, v):
+        """Match status strings case-insensitively; unknown values disable the filter"""
+        if isinstance(v, str):
+            return COURSE_STATUS_LOOKUP.get(v.strip().lower())
+        return v
 
 
 # ============================================================================
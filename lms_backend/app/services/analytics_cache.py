@@ -0,0 +1,37 @@
+"""
+Cache keys and invalidation for analytics responses
+"""
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.course import Course
+from app.services.cache_service import cache_service
+
+# Platform counters change slowly, so dashboard polls are served from cache
+PLATFORM_STATS_CACHE_KEY = "platform_stats_v1"
+PLATFORM_STATS_CACHE_TTL = 60
+
+# Tutor dashboards are cached per tutor and period; writes to their courses evict them
+TUTOR_ANALYTICS_CACHE_TTL = 120
+TUTOR_ANALYTICS_PERIODS = ("7d", "30d", "90d", "all")
+
+
+def tutor_analytics_cache_key(tutor_id: int, period: str) -> str:
+    """Cache key for one tutor's analytics over one period"""
+    return f"tutor_analytics_v1:{tutor_id}:{period}"
+
+
+async def invalidate_analytics_cache(tutor_id: Optional[int]) -> None:
+    """Evict the platform stats and every cached period of a tutor's analytics"""
+    keys = [PLATFORM_STATS_CACHE_KEY]
+    if tutor_id is not None:
+        keys.extend(tutor_analytics_cache_key(tutor_id, period) for period in TUTOR_ANALYTICS_PERIODS)
+    await cache_service.delete(*keys)
+
+
+async def invalidate_course_analytics(db: AsyncSession, course_id: int) -> None:
+    """Evict analytics affected by a write to a course or its enrollments"""
+    tutor_id = await db.scalar(select(Course.created_by).where(Course.id == course_id))
+    await invalidate_analytics_cache(tutor_id)
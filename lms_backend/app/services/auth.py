@@ -5,13 +5,13 @@ import secrets
 import string
 from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists
 from fastapi import HTTPException, status
 
 from app.models.user import User
 from app.models.organization import Organization
 from app.schemas.auth import UserRegister, UserLogin, TokenData, OrganizationRegister
-from app.core.security import verify_password, get_password_hash, create_tokens, verify_token
+from app.core.security import verify_password_async, get_password_hash_async, create_tokens, verify_token
 from app.core.config import settings
 from app.services.email_service import email_service
 from app.core.logging import app_logger
@@ -20,18 +20,16 @@ from app.core.logging import app_logger
 class AuthService:
     """Authentication service class"""
     
-    def __init__(self, db: AsyncSession):
-        self.db = db
-    
-    async def register_user(self, user_data: UserRegister) -> Dict[str, Any]:
+    @staticmethod
+    async def register_user(db: AsyncSession, user_data: UserRegister) -> Dict[str, Any]:
         """
         Register a new user
         """
         # Check if user already exists
-        existing_user = await self.db.execute(
-            select(User).where(User.email == user_data.email)
+        existing_user = await db.execute(
+            select(exists().where(User.email == user_data.email))
         )
-        if existing_user.scalar_one_or_none():
+        if existing_user.scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User with this email already exists"
@@ -39,7 +37,7 @@ class AuthService:
         
         # Check if organization exists if provided
         if user_data.organization_id:
-            org = await self.db.execute(
+            org = await db.execute(
                 select(Organization).where(Organization.id == user_data.organization_id)
             )
             if not org.scalar_one_or_none():
@@ -49,7 +47,7 @@ class AuthService:
                 )
         
         # Create new user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         user = User(
             email=user_data.email,
             hashed_password=hashed_password,
@@ -59,9 +57,9 @@ class AuthService:
             organization_id=user_data.organization_id
         )
         
-        self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        db.add(user)
+        await db.commit()
+        await db.refresh(user)
         
         # Create tokens
         tokens = create_tokens(str(user.id))
@@ -78,12 +76,13 @@ class AuthService:
             "tokens": tokens
         }
     
-    async def authenticate_user(self, user_data: UserLogin) -> Dict[str, Any]:
+    @staticmethod
+    async def authenticate_user(db: AsyncSession, user_data: UserLogin) -> Dict[str, Any]:
         """
         Authenticate user and return tokens
         """
         # Find user by email
-        user = await self.db.execute(
+        user = await db.execute(
             select(User).where(User.email == user_data.email)
         )
         user = user.scalar_one_or_none()
@@ -95,7 +94,7 @@ class AuthService:
             )
         
         # Verify password
-        if not verify_password(user_data.password, user.hashed_password):
+        if not await verify_password_async(user_data.password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -128,7 +127,8 @@ class AuthService:
             "password_change_required": password_change_required
         }
     
-    async def get_current_user(self, token: str) -> Optional[User]:
+    @staticmethod
+    async def get_current_user(db: AsyncSession, token: str) -> Optional[User]:
         """
         Get current user from token
         """
@@ -137,12 +137,13 @@ class AuthService:
             return None
         
         user_id = int(payload)
-        user = await self.db.execute(
+        user = await db.execute(
             select(User).where(User.id == user_id)
         )
         return user.scalar_one_or_none()
     
-    async def refresh_token(self, refresh_token: str) -> Dict[str, Any]:
+    @staticmethod
+    async def refresh_token(db: AsyncSession, refresh_token: str) -> Dict[str, Any]:
         """
         Refresh access token using refresh token
         """
@@ -156,7 +157,7 @@ class AuthService:
             )
         
         user_id = int(payload)
-        user = await self.db.execute(
+        user = await db.execute(
             select(User).where(User.id == user_id)
         )
         user = user.scalar_one_or_none()
@@ -182,22 +183,23 @@ class AuthService:
             "tokens": tokens
         }
     
-    async def register_organization(self, org_data: OrganizationRegister) -> Dict[str, Any]:
+    @staticmethod
+    async def register_organization(db: AsyncSession, org_data: OrganizationRegister) -> Dict[str, Any]:
         """
         Register a new organization with admin user
         """
         # Check if admin user already exists
-        existing_user = await self.db.execute(
-            select(User).where(User.email == org_data.admin_email)
+        existing_user = await db.execute(
+            select(exists().where(User.email == org_data.admin_email))
         )
-        if existing_user.scalar_one_or_none():
+        if existing_user.scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Admin user with this email already exists"
             )
         
         # Check if organization with same name exists
-        existing_org = await self.db.execute(
+        existing_org = await db.execute(
             select(Organization).where(Organization.name == org_data.name)
         )
         if existing_org.scalar_one_or_none():
@@ -218,14 +220,14 @@ class AuthService:
             size=org_data.size
         )
         
-        self.db.add(organization)
-        await self.db.commit()
-        await self.db.refresh(organization)
+        db.add(organization)
+        await db.commit()
+        await db.refresh(organization)
         
         # Use the password provided by the user, or generate a temporary one if not provided
         # Note: The schema requires admin_password, so it should always be provided
         temp_password = org_data.admin_password
-        hashed_password = get_password_hash(temp_password)
+        hashed_password = await get_password_hash_async(temp_password)
         
         # Create admin user for the organization
         admin_user = User(
@@ -239,9 +241,9 @@ class AuthService:
             password_change_required=True  # Require password change on first login
         )
         
-        self.db.add(admin_user)
-        await self.db.commit()
-        await self.db.refresh(admin_user)
+        db.add(admin_user)
+        await db.commit()
+        await db.refresh(admin_user)
         
         # Send welcome email with credentials
         # Determine login URL - use frontend URL from CORS origins or default
@@ -304,7 +306,8 @@ class AuthService:
             "email_sent": email_sent
         }
     
-    def _generate_temp_password(self, length: int = 12) -> str:
+    @staticmethod
+    def _generate_temp_password(length: int = 12) -> str:
         """Generate a secure temporary password"""
         alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
         password = ''.join(secrets.choice(alphabet) for i in range(length))
@@ -0,0 +1,118 @@
+"""
+Cache Service using Redis
+"""
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logging import app_logger
+
+
+class CacheService:
+    """Service for caching JSON payloads in Redis"""
+
+    def __init__(self):
+        """Initialize Redis client (connections are opened lazily)"""
+        try:
+            self.redis_client = redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        except Exception as e:
+            app_logger.error(f"❌ Failed to initialize Redis client: {str(e)}")
+            self.redis_client = None
+
+        # Misses currently being computed in this process, so concurrent
+        # identical requests share one computation instead of each running it
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        """
+        Get a cached JSON value
+
+        Returns:
+            The decoded value, or None on a cache miss or when Redis is unavailable
+        """
+        if self.redis_client is None:
+            return None
+
+        try:
+            cached = await self.redis_client.get(key)
+        except RedisError as e:
+            app_logger.warning(f"⚠️  Cache read failed for {key}: {str(e)}")
+            return None
+
+        return json.loads(cached) if cached is not None else None
+
+    async def set_json(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """Cache a JSON-serializable value for ttl_seconds"""
+        if self.redis_client is None:
+            return
+
+        try:
+            await self.redis_client.set(key, json.dumps(value), ex=ttl_seconds)
+        except RedisError as e:
+            app_logger.warning(f"⚠️  Cache write failed for {key}: {str(e)}")
+
+    async def get_or_compute_json(
+        self,
+        key: str,
+        ttl_seconds: int,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Get a cached JSON value, computing and caching it on a miss
+
+        Concurrent misses for the same key wait for the first caller's
+        computation; if that computation fails, each waiter computes its own.
+        Callers must not hold a database connection across this call (waiters
+        would keep theirs idle while blocked): release the request session
+        first and have compute open its own.
+        """
+        cached = await self.get_json(key)
+        if cached is not None:
+            return cached
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            value = await asyncio.shield(in_flight)
+            if value is not None:
+                return value
+            return await compute()
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        value = None
+        try:
+            value = await compute()
+            await self.set_json(key, value, ttl_seconds)
+            return value
+        finally:
+            # Waiters see None when the computation failed or was cancelled
+            future.set_result(value)
+            del self._in_flight[key]
+
+    async def delete(self, *keys: str) -> None:
+        """Remove cached values so the next read recomputes them"""
+        if self.redis_client is None or not keys:
+            return
+
+        try:
+            await self.redis_client.delete(*keys)
+        except RedisError as e:
+            app_logger.warning(f"⚠️  Cache delete failed for {', '.join(keys)}: {str(e)}")
+
+    async def close(self) -> None:
+        """Close Redis connections"""
+        if self.redis_client is not None:
+            await self.redis_client.aclose()
+
+
+# Create singleton instance
+cache_service = CacheService()
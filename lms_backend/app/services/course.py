@@ -3,12 +3,12 @@ Course service for the LMS application
 """
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy import and_, or_, func, desc, select, cast, String, delete, text
+from sqlalchemy.orm import aliased, joinedload, selectinload
+from sqlalchemy import and_, or_, func, desc, select, delete, text, tuple_
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 
-from app.models.course import Course, Topic, Lesson, Enrollment, LessonProgress, CourseInstructor, CourseReview, LessonAttachment, CourseStatus
+from app.models.course import Course, Topic, Lesson, Enrollment, LessonProgress, CourseInstructor, CourseReview, LessonAttachment
 from app.models.user import User
 from app.models.organization import Organization
 from app.schemas.course import (
@@ -17,9 +17,17 @@ from app.schemas.course import (
     EnrollmentCreate, EnrollmentUpdate, CourseStats,
     LessonAttachmentCreate, LessonAttachmentUpdate,
     CourseInstructorCreate, CourseInstructorUpdate,
-    BulkEnrollmentCreate, BulkEnrollmentResponse, BulkEnrollmentResult
+    BulkEnrollmentCreate, BulkEnrollmentResponse, BulkEnrollmentResult, EnrollmentResponse
 )
+from app.core.config import settings
 from app.core.errors import ResourceNotFoundError, AuthorizationError, ValidationError
+from app.core.logging import app_logger
+
+
+# Enrollment columns serialized by EnrollmentResponse (course is left unset)
+ENROLLMENT_RESPONSE_COLUMNS = tuple(
+    getattr(Enrollment, name) for name in EnrollmentResponse.model_fields if name != "course"
+)
 
 
 class CourseService:
@@ -146,15 +154,55 @@ class CourseService:
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_courses(
-        db: AsyncSession,
-        skip: int = 0,
-        limit: int = 100,
-        filters: Optional[CourseFilter] = None
-    ) -> tuple[List[Course], int]:
-        """Get courses with filtering and pagination"""
-        query = select(Course)
+    async def get_course_detail(db: AsyncSession, course_id: int):
+        """
+        Get a course with its organization, primary instructor and counts in one query
         
+        Returns:
+            Row of (Course, Organization, primary instructor User, total_lessons,
+            enrollment_count), or None if the course does not exist
+        """
+        total_lessons = (
+            select(func.count(Lesson.id))
+            .join(Topic, Lesson.topic_id == Topic.id)
+            .where(Topic.course_id == Course.id)
+            .correlate(Course)
+            .scalar_subquery()
+        )
+        enrollment_count = (
+            select(func.count(Enrollment.id))
+            .where(Enrollment.course_id == Course.id)
+            .correlate(Course)
+            .scalar_subquery()
+        )
+        # Primary instructor, falling back to the first one assigned
+        primary_instructor_id = (
+            select(CourseInstructor.instructor_id)
+            .where(CourseInstructor.course_id == Course.id)
+            .order_by(CourseInstructor.is_primary.desc().nulls_last(), CourseInstructor.id)
+            .limit(1)
+            .correlate(Course)
+            .scalar_subquery()
+        )
+        instructor = aliased(User, name="primary_instructor")
+        
+        result = await db.execute(
+            select(
+                Course,
+                Organization,
+                instructor,
+                total_lessons.label("total_lessons"),
+                enrollment_count.label("enrollment_count")
+            )
+            .outerjoin(Organization, Organization.id == Course.organization_id)
+            .outerjoin(instructor, instructor.id == primary_instructor_id)
+            .where(Course.id == course_id)
+        )
+        return result.one_or_none()
+    
+    @staticmethod
+    def _apply_course_filters(query, filters: Optional[CourseFilter]):
+        """Add the WHERE clauses for a course listing filter to query"""
         if filters:
             if filters.search:
                 search_term = f"%{filters.search}%"
@@ -175,25 +223,10 @@ class CourseService:
                 query = query.where(Course.price <= filters.max_price)
             
             if filters.status is not None:
-                # Handle both enum and string status values
-                # Database column is VARCHAR, so we need to compare with string value
-                # Use case-insensitive comparison to handle different case storage
-                status_value = None
-                if isinstance(filters.status, CourseStatus):
-                    # Use enum's string value
-                    status_value = filters.status.value
-                elif isinstance(filters.status, str):
-                    # Already a string
-                    status_value = filters.status
-                else:
-                    # Try to convert to string
-                    status_value = str(filters.status)
-                
-                # Use case-insensitive comparison (ILIKE for PostgreSQL, or func.lower for cross-database)
-                # Cast the column to String to ensure VARCHAR comparison, not enum
-                if status_value:
-                    # Use func.lower() for case-insensitive comparison
-                    query = query.where(func.lower(cast(Course.status, String)) == func.lower(status_value))
+                # CourseFilter normalizes status to a CourseStatus and stored values are
+                # the enum names (migration 012 rewrote legacy mixed-case VARCHAR
+                # values), so compare directly and let the status index apply
+                query = query.where(Course.status == filters.status)
             
             if filters.organization_id:
                 query = query.where(Course.organization_id == filters.organization_id)
@@ -207,15 +240,70 @@ class CourseService:
             if filters.is_featured is not None:
                 query = query.where(Course.is_featured == filters.is_featured)
         
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
+        return query
+    
+    @staticmethod
+    async def get_courses(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[CourseFilter] = None,
+        cursor: Optional[tuple[datetime, int]] = None
+    ) -> tuple[List[Course], Optional[int]]:
+        """
+        Get courses with filtering and pagination
         
-        # Apply pagination and ordering
-        query = query.order_by(desc(Course.created_at)).offset(skip).limit(limit)
+        With a cursor (created_at, id of the last course already seen) the page
+        starts right after that course, skip is ignored and no total is counted.
+        """
+        query = CourseService._apply_course_filters(select(Course), filters)
+        order = (desc(Course.created_at), desc(Course.id))
+        
+        if cursor is not None:
+            # Keyset pagination: seek past the cursor on (created_at, id)
+            query = query.where(tuple_(Course.created_at, Course.id) < tuple_(*cursor))
+            result = await db.execute(query.order_by(*order).limit(limit))
+            return result.scalars().all(), None
+        
+        # The total comes back on every row as COUNT(*) OVER (), which is evaluated
+        # over all filtered rows before OFFSET/LIMIT, so no separate count query
+        total_over = func.count().over().label("total")
+        
+        if settings.COURSE_LIST_DEFERRED_JOIN:
+            # Deferred join: walk OFFSET over ids only, then fetch the full rows for
+            # just this page. Expected plan: Nested Loop over Limit -> WindowAgg ->
+            # Index Only Scan on idx_courses_created_id (unfiltered) or
+            # idx_courses_status_org_created (status = and organization_id =
+            # filters), then Index Scan on courses_pkey per id.
+            page_ids = (
+                CourseService._apply_course_filters(select(Course.id, total_over), filters)
+                .order_by(*order)
+                .offset(skip)
+                .limit(limit)
+                .subquery("page_ids")
+            )
+            query = (
+                select(Course, page_ids.c.total)
+                .join(page_ids, Course.id == page_ids.c.id)
+                .order_by(*order)
+            )
+        else:
+            query = query.add_columns(total_over).order_by(*order).offset(skip).limit(limit)
         result = await db.execute(query)
-        courses = result.scalars().all()
+        rows = result.all()
+        courses = [row[0] for row in rows]
+        
+        if rows:
+            total = rows[0].total
+        elif skip:
+            # Past the last page there is no row to carry the total; count separately
+            count_query = select(func.count()).select_from(
+                CourseService._apply_course_filters(select(Course.id), filters).subquery()
+            )
+            total_result = await db.execute(count_query)
+            total = total_result.scalar()
+        else:
+            total = 0
         
         return courses, total
     
@@ -485,12 +573,7 @@ class CourseService:
         except Exception as e:
             # Rollback on any other error
             await db.rollback()
-            import traceback
-            import logging
-            logger = logging.getLogger(__name__)
-            error_msg = f"Error deleting course {course_id}: {str(e)}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
+            app_logger.exception(f"❌ Error deleting course {course_id}: {str(e)}")
             raise Exception(f"Failed to delete course: {str(e)}")
     
     @staticmethod
@@ -626,27 +709,27 @@ class TopicService:
     async def create_topic(db: AsyncSession, topic_data: TopicCreate, course_id: int, user_id: int) -> Topic:
         """Create a new topic"""
         try:
-            print(f"🔍 TopicService: Creating topic for course {course_id}")
-            print(f"📝 TopicService: Topic data: {topic_data}")
-            print(f"👤 TopicService: User ID: {user_id}")
+            app_logger.debug(f"🔍 TopicService: Creating topic for course {course_id}")
+            app_logger.debug(f"📝 TopicService: Topic data: {topic_data}")
+            app_logger.debug(f"👤 TopicService: User ID: {user_id}")
             
             # Verify course exists and user has access
             course = await CourseService.get_course(db, course_id)
-            print(f"📖 TopicService: Course found: {course.id if course else 'None'}")
+            app_logger.debug(f"📖 TopicService: Course found: {course.id if course else 'None'}")
             
             if not course:
                 raise ResourceNotFoundError("Course not found")
             
-            print(f"🔐 TopicService: Checking permissions - Course created by: {course.created_by}, Current user: {user_id}")
+            app_logger.debug(f"🔐 TopicService: Checking permissions - Course created by: {course.created_by}, Current user: {user_id}")
             
             if course.created_by != user_id:
                 result = await db.execute(select(User).where(User.id == user_id))
                 user = result.scalar_one_or_none()
-                print(f"👤 TopicService: User role: {user.role if user else 'None'}")
+                app_logger.debug(f"👤 TopicService: User role: {user.role if user else 'None'}")
                 if not user or user.role not in ["organization_admin", "tutor"]:  # Allow tutors too
                     raise AuthorizationError("You don't have permission to create topics for this course")
             
-            print(f"✅ TopicService: Permissions OK, creating topic...")
+            app_logger.debug("✅ TopicService: Permissions OK, creating topic...")
             
             topic = Topic(
                 course_id=course_id,
@@ -658,7 +741,7 @@ class TopicService:
                 is_required=topic_data.is_required
             )
             
-            print(f"💾 TopicService: Adding topic to database...")
+            app_logger.debug("💾 TopicService: Adding topic to database...")
             db.add(topic)
             await db.commit()
             await db.refresh(topic)
@@ -666,14 +749,11 @@ class TopicService:
             # Update course statistics after creating topic
             await CourseService.update_course_stats(db, course_id)
             
-            print(f"✅ TopicService: Topic created successfully with ID: {topic.id}")
+            app_logger.debug(f"✅ TopicService: Topic created successfully with ID: {topic.id}")
             return topic
             
         except Exception as e:
-            print(f"❌ TopicService: Error creating topic: {str(e)}")
-            print(f"🔍 TopicService: Error type: {type(e)}")
-            import traceback
-            traceback.print_exc()
+            app_logger.exception(f"❌ TopicService: Error creating topic: {str(e)}")
             raise e
     
     @staticmethod
@@ -682,10 +762,24 @@ class TopicService:
         result = await db.execute(select(Topic).where(Topic.id == topic_id))
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def get_topic_with_lessons(db: AsyncSession, topic_id: int) -> Optional[Topic]:
+        """Get a topic with its lessons loaded, in a single query"""
+        result = await db.execute(
+            select(Topic)
+            .options(joinedload(Topic.lessons))
+            .where(Topic.id == topic_id)
+        )
+        topic = result.unique().scalar_one_or_none()
+        if topic and topic.lessons:
+            # Joined rows arrive unordered; match get_topic_lessons' ordering
+            topic.lessons.sort(key=lambda l: l.order if l.order is not None else 999999)
+        return topic
+    
     @staticmethod
     async def get_course_topics(db: AsyncSession, course_id: int) -> List[Topic]:
         """Get all topics for a course"""
-        print(f"🔍 TopicService: Getting topics for course {course_id}")
+        app_logger.debug(f"🔍 TopicService: Getting topics for course {course_id}")
         result = await db.execute(
             select(Topic)
             .options(selectinload(Topic.lessons))
@@ -693,16 +787,12 @@ class TopicService:
             .order_by(Topic.order)
         )
         topics = result.scalars().all()
-        print(f"📚 TopicService: Found {len(topics)} topics for course {course_id}")
+        app_logger.debug(f"📚 TopicService: Found {len(topics)} topics for course {course_id}")
         for topic in topics:
             # Sort lessons by order to ensure consistent ordering
             # Note: selectinload doesn't support order_by directly, so we sort manually
             if topic.lessons:
                 topic.lessons.sort(key=lambda l: l.order if l.order is not None else 999999)
-            print(f"  - Topic {topic.id}: {topic.title} with {len(topic.lessons)} lessons")
-            if topic.lessons:
-                for lesson in topic.lessons:
-                    print(f"    - Lesson {lesson.id}: {lesson.title} (order: {lesson.order})")
         return topics
     
     @staticmethod
@@ -1094,27 +1184,27 @@ class EnrollmentService:
         student_id: int
     ) -> Enrollment:
         """Enroll a student in a course"""
-        print(f"🔍 EnrollmentService.enroll_in_course called with course_id={course_id}, student_id={student_id}")
+        app_logger.debug(f"🔍 EnrollmentService.enroll_in_course called with course_id={course_id}, student_id={student_id}")
         
         # Verify course exists and is published
         course = await CourseService.get_course(db, course_id)
         if not course:
-            print(f"❌ Course not found: {course_id}")
+            app_logger.debug(f"❌ Course not found: {course_id}")
             raise ResourceNotFoundError("Course not found")
         
-        print(f"📚 Course found: {course.title}, Status: {course.status}")
-        print(f"📚 Course enrollment_type: {course.enrollment_type}")
-        print(f"📚 Course price: {course.price}")
+        app_logger.debug(f"📚 Course found: {course.title}, Status: {course.status}")
+        app_logger.debug(f"📚 Course enrollment_type: {course.enrollment_type}")
+        app_logger.debug(f"📚 Course price: {course.price}")
         
         # Allow enrollment in draft courses for now (temporary fix)
         if course.status not in ["published", "draft"]:
-            print(f"❌ Course status not allowed for enrollment: {course.status}")
+            app_logger.debug(f"❌ Course status not allowed for enrollment: {course.status}")
             raise ValidationError(f"Cannot enroll in course with status: {course.status}")
         
-        print(f"✅ Course status is valid for enrollment: {course.status}")
+        app_logger.debug(f"✅ Course status is valid for enrollment: {course.status}")
         
         # Check if already enrolled
-        print(f"🔍 Checking for existing enrollment...")
+        app_logger.debug("🔍 Checking for existing enrollment...")
         result = await db.execute(
             select(Enrollment).where(
                 and_(Enrollment.course_id == course_id, Enrollment.student_id == student_id)
@@ -1123,10 +1213,10 @@ class EnrollmentService:
         existing_enrollment = result.scalar_one_or_none()
         
         if existing_enrollment:
-            print(f"⚠️ Student is already enrolled in this course: {existing_enrollment.id}")
+            app_logger.debug(f"⚠️ Student is already enrolled in this course: {existing_enrollment.id}")
             raise ValidationError("Student is already enrolled in this course")
         
-        print(f"✅ No existing enrollment found, creating new enrollment...")
+        app_logger.debug("✅ No existing enrollment found, creating new enrollment...")
         
         # Verify student exists
         student_result = await db.execute(
@@ -1134,10 +1224,10 @@ class EnrollmentService:
         )
         student = student_result.scalar_one_or_none()
         if not student:
-            print(f"❌ Student not found: {student_id}")
+            app_logger.debug(f"❌ Student not found: {student_id}")
             raise ResourceNotFoundError(f"Student with ID {student_id} not found")
         
-        print(f"✅ Student found: {student.email} (ID: {student.id})")
+        app_logger.debug(f"✅ Student found: {student.email} (ID: {student.id})")
         
         try:
             # Create enrollment
@@ -1149,18 +1239,18 @@ class EnrollmentService:
                 payment_status="pending" if course.enrollment_type == "paid" else "paid"
             )
             
-            print(f"📝 Created enrollment object: student_id={enrollment.student_id}, course_id={enrollment.course_id}")
+            app_logger.debug(f"📝 Created enrollment object: student_id={enrollment.student_id}, course_id={enrollment.course_id}")
             
             db.add(enrollment)
-            print(f"💾 Added enrollment to database session")
+            app_logger.debug("💾 Added enrollment to database session")
             
             await db.commit()
-            print(f"✅ Committed enrollment to database")
+            app_logger.debug("✅ Committed enrollment to database")
             
             # Refresh enrollment and eagerly load course relationship for response serialization
             # This prevents lazy loading issues when FastAPI serializes the response
             await db.refresh(enrollment)
-            print(f"🔄 Refreshed enrollment: {enrollment.id}")
+            app_logger.debug(f"🔄 Refreshed enrollment: {enrollment.id}")
             
             # Eagerly load the course relationship using selectinload
             # Re-query with relationship loaded to avoid lazy loading during serialization
@@ -1172,24 +1262,22 @@ class EnrollmentService:
             enrollment_with_course = enrollment_result.scalar_one_or_none()
             
             if enrollment_with_course:
-                print(f"📚 Loaded enrollment with course relationship")
+                app_logger.debug("📚 Loaded enrollment with course relationship")
                 return enrollment_with_course
             else:
                 # Fallback: manually load course if selectinload didn't work
-                print(f"⚠️ Enrollment not found after refresh, using original enrollment")
+                app_logger.debug("⚠️ Enrollment not found after refresh, using original enrollment")
                 course_result = await db.execute(
                     select(Course).where(Course.id == course_id)
                 )
                 course = course_result.scalar_one_or_none()
                 if course:
                     enrollment.course = course
-                    print(f"✅ Manually attached course: {course.title}")
+                    app_logger.debug(f"✅ Manually attached course: {course.title}")
                 return enrollment
         except Exception as e:
-            print(f"❌ Error creating enrollment: {str(e)}")
+            app_logger.exception(f"❌ Error creating enrollment: {str(e)}")
             await db.rollback()
-            import traceback
-            traceback.print_exc()
             raise ValidationError(f"Failed to create enrollment: {str(e)}")
     
     @staticmethod
@@ -1217,6 +1305,27 @@ class EnrollmentService:
         
         return enrollments, total
     
+    @staticmethod
+    async def get_course_enrollment_rows(
+        db: AsyncSession,
+        course_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Any]:
+        """
+        Get a page of a course's enrollments as rows of EnrollmentResponse columns
+        
+        Selects only the response columns and skips the total count, for listings
+        that return the rows as-is.
+        """
+        result = await db.execute(
+            select(*ENROLLMENT_RESPONSE_COLUMNS)
+            .where(Enrollment.course_id == course_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.all()
+    
     @staticmethod
     async def update_enrollment(
         db: AsyncSession,
@@ -1510,7 +1619,7 @@ class EnrollmentService:
         user_id: int
     ) -> List[Enrollment]:
         """Get all enrollments for a user"""
-        print(f"🔍 Getting enrollments for user {user_id}")
+        app_logger.debug(f"🔍 Getting enrollments for user {user_id}")
         try:
             result = await db.execute(
                 select(Enrollment)
@@ -1519,15 +1628,15 @@ class EnrollmentService:
                 .order_by(desc(Enrollment.enrollment_date))
             )
             enrollments = result.scalars().all()
-            print(f"📚 Found {len(enrollments)} enrollments for user {user_id}")
+            app_logger.debug(f"📚 Found {len(enrollments)} enrollments for user {user_id}")
             
             # Debug: Check course relationship
             for enrollment in enrollments:
-                print(f"  - Enrollment {enrollment.id}: Course ID {enrollment.course_id}")
+                app_logger.debug(f"  - Enrollment {enrollment.id}: Course ID {enrollment.course_id}")
                 if hasattr(enrollment, 'course') and enrollment.course:
-                    print(f"    Course loaded: {enrollment.course.title}")
+                    app_logger.debug(f"    Course loaded: {enrollment.course.title}")
                 else:
-                    print(f"    Course NOT loaded for enrollment {enrollment.id}")
+                    app_logger.debug(f"    Course NOT loaded for enrollment {enrollment.id}")
                     # Try to manually load the course
                     try:
                         from app.models.course import Course
@@ -1536,18 +1645,16 @@ class EnrollmentService:
                         )
                         course = course_result.scalar_one_or_none()
                         if course:
-                            print(f"    Manually loaded course: {course.title}")
+                            app_logger.debug(f"    Manually loaded course: {course.title}")
                             enrollment.course = course
                         else:
-                            print(f"    Course {enrollment.course_id} not found in database")
+                            app_logger.debug(f"    Course {enrollment.course_id} not found in database")
                     except Exception as e:
-                        print(f"    Error manually loading course: {str(e)}")
+                        app_logger.debug(f"    Error manually loading course: {str(e)}")
             
             return enrollments
         except Exception as e:
-            print(f"❌ Error in get_user_enrollments: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            app_logger.exception(f"❌ Error in get_user_enrollments: {str(e)}")
             raise e
 
 
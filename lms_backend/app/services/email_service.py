@@ -1,7 +1,10 @@
 """
 Email Service using AWS SES
 """
+import asyncio
 import boto3
+from aiolimiter import AsyncLimiter
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
 from typing import Optional, Dict, Any
 from email.mime.text import MIMEText
@@ -12,6 +15,25 @@ from app.core.config import settings
 from app.core.logging import app_logger
 
 
+# SES default sending quota is 14 messages per second
+SES_MAX_CONCURRENT_SENDS = 14
+SES_MAX_SEND_RATE = 14
+
+# Throttled sends are retried with exponential backoff
+SES_SEND_ATTEMPTS = 3
+SES_RETRY_BASE_DELAY = 0.5
+
+# Keep one pooled keep-alive connection per concurrent send thread (botocore
+# defaults to 10, fewer than SES_MAX_CONCURRENT_SENDS). botocore's own retries
+# are off because throttled sends are retried by _send_with_retry, which waits
+# for a rate limiter slot before each attempt.
+SES_CLIENT_CONFIG = Config(
+    max_pool_connections=SES_MAX_CONCURRENT_SENDS,
+    tcp_keepalive=True,
+    retries={'total_max_attempts': 1, 'mode': 'standard'}
+)
+
+
 class EmailService:
     """Service for sending emails via AWS SES"""
     
@@ -28,18 +50,25 @@ class EmailService:
                         'ses',
                         aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                         aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                        region_name=settings.AWS_REGION
+                        region_name=settings.AWS_REGION,
+                        config=SES_CLIENT_CONFIG
                     )
                 else:
                     # Use IAM role (for EC2)
                     self.ses_client = boto3.client(
                         'ses',
-                        region_name=settings.AWS_REGION
+                        region_name=settings.AWS_REGION,
+                        config=SES_CLIENT_CONFIG
                     )
                 app_logger.info(f"✅ SES client initialized for region: {settings.AWS_REGION}")
             except Exception as e:
                 app_logger.error(f"❌ Failed to initialize SES client: {str(e)}")
                 self.ses_client = None
+        
+        # boto3 is blocking, so sends run in worker threads capped at the SES rate;
+        # the semaphore bounds in-flight sends and the limiter paces their start
+        self._send_semaphore = asyncio.Semaphore(SES_MAX_CONCURRENT_SENDS)
+        self._send_limiter = AsyncLimiter(SES_MAX_SEND_RATE, 1.0)
     
     def is_configured(self) -> bool:
         """Check if SES is properly configured"""
@@ -51,6 +80,32 @@ class EmailService:
             app_logger.warning(f"   - AWS_REGION: {settings.AWS_REGION or '❌ Not set'}")
         return is_configured
     
+    @staticmethod
+    def _is_throttled(error: ClientError) -> bool:
+        """Check whether SES rejected a send for exceeding the sending rate"""
+        error_code = error.response.get('Error', {}).get('Code', '')
+        status_code = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+        return status_code == 429 or 'Throttling' in error_code or 'Throttling' in str(error)
+    
+    async def _send_with_retry(self, **kwargs) -> Dict[str, Any]:
+        """
+        Call SES send_email, backing off and retrying when throttled
+        
+        Raises:
+            ClientError: When SES rejects the send, or is still throttling after the last attempt
+        """
+        delay = SES_RETRY_BASE_DELAY
+        for attempt in range(1, SES_SEND_ATTEMPTS + 1):
+            try:
+                async with self._send_semaphore, self._send_limiter:
+                    return await asyncio.to_thread(self.ses_client.send_email, **kwargs)
+            except ClientError as e:
+                if attempt == SES_SEND_ATTEMPTS or not self._is_throttled(e):
+                    raise
+                app_logger.warning(f"⚠️  SES throttled send (attempt {attempt}/{SES_SEND_ATTEMPTS}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+                delay *= 2
+    
     async def send_email(
         self,
         to_email: str,
@@ -93,7 +148,7 @@ class EmailService:
                 message['Body']['Text'] = {'Data': text_body, 'Charset': 'UTF-8'}
             
             # Send email
-            response = self.ses_client.send_email(
+            response = await self._send_with_retry(
                 Source=f"{from_name} <{from_email}>",
                 Destination={'ToAddresses': [to_email]},
                 Message=message
@@ -108,10 +163,10 @@ class EmailService:
             
             # Check for sandbox mode errors
             if 'MessageRejected' in error_code or 'Email address is not verified' in error_message:
-                app_logger.error(f"❌ AWS SES Error: Email address is not verified")
+                app_logger.error("❌ AWS SES Error: Email address is not verified")
                 app_logger.error(f"   Recipient: {to_email}")
                 app_logger.error(f"   Error: {error_message}")
-                app_logger.error(f"   ⚠️  AWS SES is in SANDBOX MODE - recipient email must be verified")
+                app_logger.error("   ⚠️  AWS SES is in SANDBOX MODE - recipient email must be verified")
                 app_logger.error(f"   Solution: Verify '{to_email}' in AWS SES Console or request production access")
                 app_logger.error(f"   SES Console: https://console.aws.amazon.com/ses/home?region={settings.AWS_REGION}#/verified-identities")
             else:
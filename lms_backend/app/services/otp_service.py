@@ -5,7 +5,7 @@ import secrets
 from datetime import datetime, timedelta
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_
 
 from app.models.otp import OTP
 from app.services.email_service import email_service
@@ -28,20 +28,25 @@ class OTPService:
         purpose: str = "registration",
         expires_in_minutes: int = 10
     ) -> OTP:
-        """Create a new OTP for email verification"""
-        # Invalidate any existing OTPs for this email and purpose
-        existing_otps = await db.execute(
-            select(OTP).where(
+        """
+        Create a new OTP for email verification
+        
+        The returned OTP is not refreshed after commit, so server-generated
+        columns such as created_at are not loaded; callers only need the code.
+        """
+        # Invalidate any existing OTPs for this email and purpose (mark as used) in one statement
+        await db.execute(
+            update(OTP)
+            .where(
                 and_(
                     OTP.email == email,
                     OTP.purpose == purpose,
                     OTP.is_verified == False
                 )
             )
+            .values(is_verified=True)
+            .execution_options(synchronize_session=False)
         )
-        existing_otps_list = existing_otps.scalars().all()
-        for otp in existing_otps_list:
-            otp.is_verified = True  # Mark as used
         
         # Generate new OTP
         code = OTPService.generate_otp()
@@ -57,7 +62,6 @@ class OTPService:
         
         db.add(otp)
         await db.commit()
-        await db.refresh(otp)
         
         return otp
     
@@ -69,8 +73,11 @@ class OTPService:
         purpose: str = "registration"
     ) -> bool:
         """Verify an OTP code"""
-        result = await db.execute(
-            select(OTP).where(
+        # Find the newest matching unverified OTP and mark it verified in a single
+        # UPDATE ... RETURNING, so a code can only be consumed once
+        latest_match = (
+            select(OTP.id)
+            .where(
                 and_(
                     OTP.email == email,
                     OTP.code == code,
@@ -78,19 +85,24 @@ class OTPService:
                     OTP.is_verified == False,
                     OTP.expires_at > datetime.utcnow()
                 )
-            ).order_by(OTP.created_at.desc())
+            )
+            .order_by(OTP.created_at.desc())
+            .limit(1)
+            # Standalone lookup; must not correlate with the otps row being updated
+            .correlate(None)
+            .scalar_subquery()
         )
-        otp = result.scalar_one_or_none()
-        
-        if not otp:
-            return False
-        
-        # Mark OTP as verified
-        otp.is_verified = True
-        otp.verified_at = datetime.utcnow()
+        result = await db.execute(
+            update(OTP)
+            .where(OTP.id == latest_match, OTP.is_verified == False)
+            .values(is_verified=True, verified_at=datetime.utcnow())
+            .returning(OTP.id)
+            .execution_options(synchronize_session=False)
+        )
+        verified_id = result.scalar_one_or_none()
         await db.commit()
         
-        return True
+        return verified_id is not None
     
     @staticmethod
     async def send_otp_email(
@@ -13,7 +13,7 @@ from app.models.user import User
 from app.models.organization import Organization
 from app.models.rbac import Role
 from app.schemas.user import UserCreate, UserUpdate, UserAdminUpdate, UserFilter, UserStats
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
 from app.core.config import settings
 from app.services.rbac import RBACService
 from app.services.email_service import email_service
@@ -50,12 +50,12 @@ class UserService:
             
             if password_provided:
                 # Password provided - use it (validation already done by Pydantic schema)
-                hashed_password = get_password_hash(user_data.password)
+                hashed_password = await get_password_hash_async(user_data.password)
                 password_change_required = False
             else:
                 # No password provided - generate temp password (for admin-created users)
                 temp_password = UserService._generate_temp_password()
-                hashed_password = get_password_hash(temp_password)
+                hashed_password = await get_password_hash_async(temp_password)
                 password_change_required = True
             
             # Determine role from user_data.roles or default to "student"
@@ -123,7 +123,7 @@ class UserService:
                         app_logger.info(f"✅ Welcome email sent successfully to {user.email}")
                     else:
                         app_logger.error(f"❌ Failed to send welcome email to {user.email}")
-                        app_logger.error(f"   ⚠️  If AWS SES is in sandbox mode, recipient email must be verified")
+                        app_logger.error("   ⚠️  If AWS SES is in sandbox mode, recipient email must be verified")
                         app_logger.error(f"   Verify email: https://console.aws.amazon.com/ses/home?region={settings.AWS_REGION}#/verified-identities")
                 except Exception as e:
                     app_logger.error(f"❌ Exception while sending welcome email to {user.email}: {str(e)}")
@@ -414,11 +414,11 @@ class UserService:
                 raise ResourceNotFoundError("User not found")
             
             # Verify current password
-            if not verify_password(current_password, user.hashed_password):
+            if not await verify_password_async(current_password, user.hashed_password):
                 raise ValidationError("Current password is incorrect")
             
             # Hash new password
-            hashed_password = get_password_hash(new_password)
+            hashed_password = await get_password_hash_async(new_password)
             user.hashed_password = hashed_password
             user.password_change_required = False  # Clear password change requirement
             user.updated_at = datetime.utcnow()
@@ -470,13 +470,13 @@ class UserService:
             temp_password = None
             if new_password and new_password.strip():
                 # Use provided password
-                hashed_password = get_password_hash(new_password.strip())
+                hashed_password = await get_password_hash_async(new_password.strip())
                 password_change_required = False
                 final_password = new_password.strip()
             else:
                 # Generate temporary password
                 temp_password = UserService._generate_temp_password()
-                hashed_password = get_password_hash(temp_password)
+                hashed_password = await get_password_hash_async(temp_password)
                 password_change_required = True
                 final_password = temp_password
             
@@ -552,7 +552,7 @@ class UserService:
                         app_logger.info(f"✅ Password reset email sent successfully to {user.email}")
                     else:
                         app_logger.error(f"❌ Failed to send password reset email to {user.email}")
-                        app_logger.error(f"   ⚠️  If AWS SES is in sandbox mode, recipient email must be verified")
+                        app_logger.error("   ⚠️  If AWS SES is in sandbox mode, recipient email must be verified")
                 except Exception as e:
                     app_logger.error(f"❌ Exception while sending password reset email to {user.email}: {str(e)}")
                     import traceback
@@ -705,12 +705,12 @@ class UserService:
             if password_provided:
                 # Password provided by organization admin - use it
                 # Validation is already done by Pydantic schema
-                hashed_password = get_password_hash(tutor_data["password"])
+                hashed_password = await get_password_hash_async(tutor_data["password"])
                 password_change_required = False
             else:
                 # No password provided - generate temp password
                 temp_password = UserService._generate_temp_password()
-                hashed_password = get_password_hash(temp_password)
+                hashed_password = await get_password_hash_async(temp_password)
                 password_change_required = True
             
             # Get organization name for email
@@ -770,7 +770,7 @@ class UserService:
                         app_logger.info(f"✅ Welcome email sent successfully to {tutor.email}")
                     else:
                         app_logger.error(f"❌ Failed to send welcome email to {tutor.email}")
-                        app_logger.error(f"   ⚠️  If AWS SES is in sandbox mode, recipient email must be verified")
+                        app_logger.error("   ⚠️  If AWS SES is in sandbox mode, recipient email must be verified")
                         app_logger.error(f"   Verify email: https://console.aws.amazon.com/ses/home?region={settings.AWS_REGION}#/verified-identities")
                 except Exception as e:
                     app_logger.error(f"❌ Exception while sending welcome email to {tutor.email}: {str(e)}")
@@ -81,8 +81,7 @@ async def debug_registration():
                 admin_last_name="User"
             )
             
-            auth_service = AuthService(db)
-            result = await auth_service.register_organization(org_data)
+            result = await AuthService.register_organization(db, org_data)
             print("✅ Organization registration successful!")
             print(f"Organization ID: {result['organization']['id']}")
             print(f"Admin User ID: {result['admin_user']['id']}")
@@ -99,7 +98,7 @@ async def debug_registration():
                 organization_id=result['organization']['id']
             )
             
-            result = await auth_service.register_user(user_data)
+            result = await AuthService.register_user(db, user_data)
             print("✅ User registration successful!")
             print(f"User ID: {result['user']['id']}")
             print(f"Access Token: {result['tokens']['access_token'][:50]}...")
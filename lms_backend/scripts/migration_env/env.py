@@ -0,0 +1,31 @@
+"""
+Test-only Alembic environment used by scripts/verify_migrations.py
+
+Unlike alembic/env.py it has no deployment host check and no offline mode;
+it migrates whatever database sqlalchemy.url points at, so only point it at
+a throwaway database.
+"""
+from sqlalchemy import engine_from_config
+from sqlalchemy import pool
+
+from alembic import context
+
+config = context.config
+
+
+def run_migrations_online() -> None:
+    """Run migrations against the database in sqlalchemy.url"""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(connection=connection)
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+run_migrations_online()
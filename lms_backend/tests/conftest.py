@@ -0,0 +1,82 @@
+"""
+Shared fixtures for the test suite
+
+Database-backed tests run against TEST_DATABASE_URL (a throwaway PostgreSQL
+database whose tables are dropped and recreated for every test) and are
+skipped when it is not set.
+"""
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base, get_db
+from app.core.dependencies import get_current_user
+from app.main import app
+from app.models import user, course, assessment, analytics, organization, rbac
+from app.services.cache_service import cache_service
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory bound to a freshly created test schema"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    # NullPool: TestClient runs the app on its own event loop, so connections
+    # must not be shared between it and the test's asyncio.run() calls
+    engine = create_async_engine(
+        TEST_DATABASE_URL.replace("postgresql://", "postgresql+psycopg://"),
+        poolclass=NullPool,
+    )
+
+    async def reset_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(reset_schema())
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def db_client(session_factory):
+    """TestClient whose requests use the test database"""
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def client_as(monkeypatch):
+    """Build a TestClient authenticated as a user with the given role, with no cache"""
+    async def no_cache(key):
+        return None
+
+    async def skip_cache_write(key, value, ttl_seconds):
+        return None
+
+    monkeypatch.setattr(cache_service, "get_json", no_cache)
+    monkeypatch.setattr(cache_service, "set_json", skip_cache_write)
+
+    def build(role: str) -> TestClient:
+        user = SimpleNamespace(id=1, organization_id=1, role=role, is_active=True)
+        app.dependency_overrides[get_current_user] = lambda: user
+        return TestClient(app)
+
+    yield build
+    app.dependency_overrides.pop(get_current_user, None)
@@ -0,0 +1,136 @@
+"""
+Tests for analytics endpoint responses
+"""
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import text
+from starlette.requests import Request
+
+from app.api.v1 import analytics
+from app.api.v1.analytics import _cacheable_response
+from app.models.organization import Organization
+
+PAYLOAD = {"total_users": 3, "total_courses": 2}
+PLATFORM_STATS_URL = "/api/v1/analytics/platform/stats"
+TUTOR_ANALYTICS_URL = "/api/v1/analytics/tutor"
+
+
+def make_request(if_none_match: str = None) -> Request:
+    """Bare GET request, optionally carrying an If-None-Match header"""
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_cacheable_response_sets_etag_and_cache_control():
+    """A first request gets the body plus validators"""
+    response = _cacheable_response(make_request(), PAYLOAD, 30)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, max-age=30"
+    assert response.headers["etag"].startswith('"')
+    assert response.body
+
+
+def test_cacheable_response_matching_if_none_match_returns_304():
+    """A client holding the same payload gets a bodyless 304 with the same ETag"""
+    etag = _cacheable_response(make_request(), PAYLOAD, 30).headers["etag"]
+
+    for if_none_match in (etag, f"W/{etag}", f'"stale", {etag}'):
+        response = _cacheable_response(make_request(if_none_match), PAYLOAD, 30)
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+
+def test_cacheable_response_changed_payload_returns_200():
+    """An ETag for an older payload does not match"""
+    etag = _cacheable_response(make_request(), PAYLOAD, 30).headers["etag"]
+
+    response = _cacheable_response(make_request(etag), {**PAYLOAD, "total_users": 4}, 30)
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_platform_stats_forbidden_for_tutor(client_as):
+    """require_roles rejects other roles before any stats are computed"""
+    response = client_as("tutor").get(PLATFORM_STATS_URL)
+    assert response.status_code == 403
+    assert response.json()["error"]["message"] == "Only super admins can access platform stats"
+
+
+def test_platform_stats_allowed_for_super_admin(client_as, monkeypatch):
+    """require_roles passes the user through when the role matches"""
+    async def compute_platform_stats():
+        return PAYLOAD
+
+    monkeypatch.setattr(analytics, "_compute_platform_stats", compute_platform_stats)
+
+    response = client_as("super_admin").get(PLATFORM_STATS_URL)
+    assert response.status_code == 200
+    assert response.json() == PAYLOAD
+
+
+def test_tutor_analytics_forbidden_for_student(client_as):
+    """Only tutors and instructors may read tutor analytics"""
+    response = client_as("student").get(TUTOR_ANALYTICS_URL)
+    assert response.status_code == 403
+
+
+def reset_platform_counters(session_factory, counters: dict = None):
+    """Drop platform_counters, then recreate it (sharded, as in revision 011) holding counters"""
+    async def reset():
+        async with session_factory() as db:
+            await db.execute(text("DROP TABLE IF EXISTS platform_counters"))
+            if counters is not None:
+                await db.execute(text(
+                    "CREATE TABLE platform_counters ("
+                    "key TEXT, slot SMALLINT, value BIGINT NOT NULL DEFAULT 0, PRIMARY KEY (key, slot))"
+                ))
+                for key, values in counters.items():
+                    for slot, value in enumerate(values):
+                        await db.execute(
+                            text("INSERT INTO platform_counters (key, slot, value) VALUES (:key, :slot, :value)"),
+                            {"key": key, "slot": slot, "value": value},
+                        )
+            await db.commit()
+
+    asyncio.run(reset())
+
+
+@pytest.mark.parametrize("counters, expected", [
+    # Slots are summed per counter
+    (
+        {"total_organizations": [2, 1], "active_organizations": [1, 1],
+         "total_users": [5, 0, 2], "total_courses": [4]},
+        {"total_organizations": 3, "active_organizations": 2, "total_users": 7, "total_courses": 4},
+    ),
+    # Without the table the totals are counted live (one active organization is seeded)
+    (
+        None,
+        {"total_organizations": 1, "active_organizations": 1, "total_users": 0, "total_courses": 0},
+    ),
+])
+def test_platform_stats_reads_database(session_factory, client_as, monkeypatch, counters, expected):
+    """Platform stats come back as plain ints that both JSON encoders accept"""
+    monkeypatch.setattr(analytics, "AsyncSessionLocal", session_factory)
+
+    async def seed_organization():
+        async with session_factory() as db:
+            db.add(Organization(name="Test Organization", is_active=True))
+            await db.commit()
+
+    asyncio.run(seed_organization())
+    reset_platform_counters(session_factory, counters)
+    try:
+        stats = asyncio.run(analytics._compute_platform_stats())
+        assert {key: stats[key] for key in expected} == expected
+        assert all(type(stats[key]) is int for key in expected)
+        # The cache stores the payload with json.dumps
+        json.dumps(stats)
+
+        response = client_as("super_admin").get(PLATFORM_STATS_URL)
+        assert response.status_code == 200
+        assert response.json()["total_users"] == expected["total_users"]
+    finally:
+        reset_platform_counters(session_factory)
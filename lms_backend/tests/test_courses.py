@@ -0,0 +1,124 @@
+"""
+Tests for course listing pagination
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.models.course import Course, CourseStatus
+from app.models.organization import Organization
+from app.models.user import User
+from app.schemas.course import CourseFilter
+
+COURSES_URL = "/api/v1/courses/"
+
+
+def seed_courses(
+    session_factory,
+    count: int,
+    created_at: datetime = None,
+    status: CourseStatus = CourseStatus.PUBLISHED
+) -> list:
+    """Create count courses (optionally all with the same created_at) and return their ids"""
+    async def seed():
+        async with session_factory() as db:
+            org = Organization(name=f"Test Organization {status.value}")
+            db.add(org)
+            await db.flush()
+            tutor = User(
+                email=f"tutor-{status.value}@example.com",
+                hashed_password="not-a-real-hash",
+                first_name="Test",
+                last_name="Tutor",
+                role="tutor",
+                organization_id=org.id,
+            )
+            db.add(tutor)
+            await db.flush()
+            courses = [
+                Course(
+                    title=f"Course {i}",
+                    slug=f"{status.value}-course-{i}",
+                    organization_id=org.id,
+                    created_by=tutor.id,
+                    status=status,
+                    **({"created_at": created_at} if created_at else {}),
+                )
+                for i in range(count)
+            ]
+            db.add_all(courses)
+            await db.commit()
+            return [c.id for c in courses]
+
+    return asyncio.run(seed())
+
+
+def test_invalid_cursor_returns_400():
+    """A cursor that does not decode is rejected before any query runs"""
+    response = TestClient(app).get(COURSES_URL, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json()["error"]["message"] == "Invalid cursor"
+
+
+def test_cursor_walk_with_tied_created_at(session_factory, db_client):
+    """Courses sharing created_at are neither skipped nor repeated across cursor pages"""
+    tied = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    ids = seed_courses(session_factory, 5, created_at=tied)
+
+    first = db_client.get(COURSES_URL, params={"size": 2}).json()
+    assert first["total"] == 5
+    seen = [c["id"] for c in first["courses"]]
+    cursor = first["next_cursor"]
+
+    while cursor:
+        page = db_client.get(COURSES_URL, params={"size": 2, "cursor": cursor}).json()
+        # Cursor pages are not counted and always report page 1
+        assert page["total"] is None
+        assert page["pages"] is None
+        assert page["page"] == 1
+        seen.extend(c["id"] for c in page["courses"])
+        cursor = page["next_cursor"]
+
+    assert seen == sorted(ids, reverse=True)
+
+
+@pytest.mark.parametrize("deferred_join", [False, True])
+def test_offset_past_the_end_still_reports_total(session_factory, db_client, monkeypatch, deferred_join):
+    """An empty page past the end falls back to a separate count for total/pages"""
+    monkeypatch.setattr(settings, "COURSE_LIST_DEFERRED_JOIN", deferred_join)
+    seed_courses(session_factory, 3)
+
+    response = db_client.get(COURSES_URL, params={"page": 5, "size": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["courses"] == []
+    assert data["total"] == 3
+    assert data["pages"] == 2
+    assert data["page"] == 5
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Published", CourseStatus.PUBLISHED),
+    (" DRAFT ", CourseStatus.DRAFT),
+    ("archived", CourseStatus.ARCHIVED),
+    ("unknown", None),
+    (None, None),
+])
+def test_course_filter_normalizes_status(raw, expected):
+    """Status strings match case-insensitively; unknown values disable the filter"""
+    assert CourseFilter(status=raw).status is expected
+
+
+def test_status_filter_matches_enum_column(session_factory, db_client):
+    """A normalized status filter compares against the native enum column"""
+    published = seed_courses(session_factory, 2)
+    seed_courses(session_factory, 1, status=CourseStatus.DRAFT)
+
+    data = db_client.get(COURSES_URL, params={"status": "Published"}).json()
+    assert sorted(c["id"] for c in data["courses"]) == sorted(published)
+    assert data["total"] == 2
@@ -0,0 +1,40 @@
+"""
+Tests for OTP verification
+"""
+import asyncio
+
+from app.services.otp_service import OTPService
+
+EMAIL = "student@example.com"
+
+
+def test_verify_otp_consumes_code_once(session_factory, monkeypatch):
+    """A code verifies once; replaying it fails"""
+    monkeypatch.setattr(OTPService, "generate_otp", staticmethod(lambda: "123456"))
+
+    async def run():
+        async with session_factory() as db:
+            await OTPService.create_otp(db, EMAIL)
+            return [
+                await OTPService.verify_otp(db, EMAIL, "123456"),
+                await OTPService.verify_otp(db, EMAIL, "123456"),
+            ]
+
+    assert asyncio.run(run()) == [True, False]
+
+
+def test_verify_otp_rejects_superseded_code(session_factory, monkeypatch):
+    """Requesting a new code invalidates the previous one"""
+    codes = iter(["111111", "222222"])
+    monkeypatch.setattr(OTPService, "generate_otp", staticmethod(lambda: next(codes)))
+
+    async def run():
+        async with session_factory() as db:
+            await OTPService.create_otp(db, EMAIL)
+            await OTPService.create_otp(db, EMAIL)
+            return [
+                await OTPService.verify_otp(db, EMAIL, "111111"),
+                await OTPService.verify_otp(db, EMAIL, "222222"),
+            ]
+
+    assert asyncio.run(run()) == [False, True]
@@ -0,0 +1,10 @@
+"""
+Tests for RBAC endpoint access control
+"""
+ROLES_URL = "/api/v1/rbac/roles"
+
+
+def test_create_role_forbidden_for_tutor(client_as):
+    """require_super_admin rejects other roles before the body is used"""
+    response = client_as("tutor").post(ROLES_URL, json={"name": "reviewer"})
+    assert response.status_code == 403